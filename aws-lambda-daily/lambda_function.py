@@ -185,7 +185,8 @@ def send_report(db_config: Dict[str, str], params: Dict[str, Any] = None) -> Dic
     Generate a PDF news impact report and send it to Telegram.
 
     Params:
-        (none required — uses TELEGRAM_BOT_TOKEN and TELEGRAM_CHAT_ID env vars)
+        force (bool): Re-send even if the same report was sent within the last hour
+        (uses TELEGRAM_BOT_TOKEN and TELEGRAM_CHAT_ID env vars)
     """
     try:
         if TelegramReportService is None:
@@ -194,7 +195,7 @@ def send_report(db_config: Dict[str, str], params: Dict[str, Any] = None) -> Dic
                 'error': 'TelegramReportService unavailable — fpdf2 package is missing from the Lambda layer'
             }
         service = TelegramReportService(db_config=db_config)
-        result = service.generate_and_send_report()
+        result = service.generate_and_send_report(force=bool((params or {}).get('force')))
         return result
     except Exception as e:
         logger.error(f"Error sending report: {e}", exc_info=True)
@@ -566,7 +566,7 @@ class EventStudyService:
 
             processed = 0
             for article in articles:
-                tickers = [t.strip() for t in article['stock_tickers'].split(',') if t.strip()]
+                tickers = [t for t in map(str.strip, article['stock_tickers'].split(',')) if t]
                 
                 for ticker in tickers:
                     result = self.compute_event_windows(
@@ -295,7 +295,7 @@ class StockPriceService:
             # Group by ticker -> merge overlapping date ranges
             ticker_dates = {}
             for article in articles:
-                tickers = [t.strip() for t in article['stock_tickers'].split(',') if t.strip()]
+                tickers = [t for t in map(str.strip, article['stock_tickers'].split(',')) if t]
                 pub_date = article['published_at']
                 if pub_date:
                     for ticker in tickers:
@@ -370,7 +370,7 @@ class StockPriceService:
 
                 snapshot_count = 0
                 for article in articles:
-                    tickers = [t.strip() for t in article['stock_tickers'].split(',') if t.strip()]
+                    tickers = [t for t in map(str.strip, article['stock_tickers'].split(',')) if t]
                     pub_date = article['published_at']
 
                     if not pub_date:
@@ -6,6 +6,7 @@ Generates PDF reports of news impact analysis and sends them via Telegram Bot AP
 Requirements:
     - fpdf2 (pip install fpdf2) — lightweight PDF generation, no system deps
     - TELEGRAM_BOT_TOKEN and TELEGRAM_CHAT_ID environment variables
+    - orjson (optional) — faster Telegram payload (de)serialization
 
 Usage:
     service = TelegramReportService(db_config=db_config)
@@ -15,23 +16,164 @@ Usage:
 import os
 import io
 import json
+import time
+import hashlib
 import logging
+import threading
+from contextlib import contextmanager
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from concurrent.futures import ThreadPoolExecutor
+from http.client import HTTPSConnection
+from typing import Dict, List, Optional, Any, Tuple
+from urllib.parse import urlsplit
 from urllib.request import urlopen, Request
 from urllib.error import HTTPError
 
 import pymysql
+from pymysql.constants import CLIENT
 from fpdf import FPDF
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize a Telegram payload to UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse a Telegram API response body (bytes)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Module-level so it survives across warm Lambda invocations.
+# {(report_key, chat_id): sent_at}
+_SENT_REPORTS: Dict[Tuple[str, str], float] = {}
+
+# Outbound Bot API throttling: bound concurrent calls per process and
+# respect Telegram's limit of one message per second per chat.
+_TELEGRAM_MAX_CONCURRENT = 4
+_TELEGRAM_CHAT_INTERVAL = 1.0
+_telegram_slots = threading.BoundedSemaphore(_TELEGRAM_MAX_CONCURRENT)
+_chat_next_send: Dict[str, float] = {}
+_chat_lock = threading.Lock()
+
+
+@contextmanager
+def _telegram_send_slot(chat_id: str):
+    """Wait for a free concurrency slot and the chat's next allowed send time."""
+    with _telegram_slots:
+        with _chat_lock:
+            now = time.monotonic()
+            send_at = max(now, _chat_next_send.get(chat_id, 0.0))
+            _chat_next_send[chat_id] = send_at + _TELEGRAM_CHAT_INTERVAL
+        if send_at > now:
+            time.sleep(send_at - now)
+        yield
+
+
+class _Latin1Table(dict):
+    """str.translate table mapping non-latin-1 code points to '?' (lazily filled)."""
+
+    def __missing__(self, codepoint):
+        value = codepoint if codepoint < 0x100 else '?'
+        self[codepoint] = value
+        return value
+
+
+# Core PDF fonts only cover latin-1
+_LATIN1_TABLE = _Latin1Table()
+
+# (header, width, align) per column
+_IMPACT_COLUMNS = (
+    ('Ticker', 18, 'L'),
+    ('Change %', 20, 'R'),
+    ('Pub Price', 28, 'R'),
+    ('Next Day', 28, 'R'),
+    ('Article Title', 96, 'L'),
+)
+_VOLUME_COLUMNS = (
+    ('Ticker', 18, 'L'),
+    ('News Vol', 28, 'R'),
+    ('Avg Vol', 28, 'R'),
+    ('Ratio', 20, 'R'),
+    ('Price %', 20, 'R'),
+    ('Article Title', 76, 'L'),
+)
+
+
 class TelegramReportService:
     """Generate PDF news impact reports and send via Telegram."""
 
     TELEGRAM_API_URL = "https://api.telegram.org/bot{token}"
 
+    # Seconds an identical report is not re-sent to the same chat
+    REPORT_CACHE_TTL = 3600
+
+    # Articles sorted by absolute price change. The top-K snapshots are picked
+    # from idx_abs_change first so only K rss_items rows are joined.
+    PRICE_IMPACT_SQL = """SELECT
+            ri.title, ri.published_at, ri.stock_tickers,
+            top.ticker, top.price_at_publication,
+            top.price_current AS price_next_day,
+            top.price_change_since_article AS change_pct
+        FROM (
+            SELECT article_id, ticker, price_at_publication, price_current,
+                   price_change_since_article, abs_change
+            FROM article_stock_snapshots
+            WHERE price_at_publication IS NOT NULL
+              AND price_change_since_article IS NOT NULL
+            ORDER BY abs_change DESC
+            LIMIT %s
+        ) top
+        JOIN rss_items ri ON top.article_id = ri.id
+        ORDER BY top.abs_change DESC"""
+
+    # Articles with unusual volume activity
+    VOLUME_SQL = """SELECT
+            ri.title, ri.published_at,
+            ass.ticker,
+            sp_news.volume AS news_volume,
+            sp_news.close_price,
+            sp_news.change_percent,
+            (SELECT AVG(sp2.volume) FROM stock_prices sp2
+             WHERE sp2.ticker = ass.ticker) AS avg_volume
+        FROM article_stock_snapshots ass
+        JOIN rss_items ri ON ass.article_id = ri.id
+        LEFT JOIN stock_prices sp_news ON sp_news.ticker = ass.ticker
+            AND sp_news.price_date = (
+                SELECT MIN(sp3.price_date) FROM stock_prices sp3
+                WHERE sp3.ticker = ass.ticker
+                  AND sp3.price_date >= DATE(ri.published_at)
+            )
+        WHERE sp_news.volume IS NOT NULL
+          AND sp_news.volume > 0
+        ORDER BY (sp_news.volume / NULLIF(
+            (SELECT AVG(sp4.volume) FROM stock_prices sp4
+             WHERE sp4.ticker = ass.ticker), 0)) DESC
+        LIMIT %s"""
+
+    # Summary statistics for the report
+    SUMMARY_STATS_SQL = """SELECT
+            COUNT(*) AS total_snapshots,
+            SUM(CASE WHEN price_change_since_article > 0 THEN 1 ELSE 0 END) AS positive,
+            SUM(CASE WHEN price_change_since_article < 0 THEN 1 ELSE 0 END) AS negative,
+            SUM(CASE WHEN price_change_since_article = 0 THEN 1 ELSE 0 END) AS neutral,
+            AVG(price_change_since_article) AS avg_change,
+            MAX(price_change_since_article) AS max_gain,
+            MIN(price_change_since_article) AS max_loss
+        FROM article_stock_snapshots
+        WHERE price_change_since_article IS NOT NULL"""
+
     def __init__(self, db_config: Dict = None, bot_token: str = None, chat_id: str = None):
         self.bot_token = bot_token or os.environ.get('TELEGRAM_BOT_TOKEN', '')
         self.chat_id = chat_id or os.environ.get('TELEGRAM_CHAT_ID', '')
@@ -46,92 +188,43 @@ class TelegramReportService:
                 'port': int(os.environ.get('DB_PORT', 3306)),
             }
 
-    def _get_connection(self):
+    def _get_connection(self, client_flag: int = 0):
         return pymysql.connect(
             **self.db_config,
             charset='utf8mb4',
-            cursorclass=pymysql.cursors.DictCursor
+            cursorclass=pymysql.cursors.DictCursor,
+            client_flag=client_flag
         )
 
     # ------------------------------------------------------------------
     # Data queries
     # ------------------------------------------------------------------
 
-    def _get_price_impact_data(self, limit: int = 20) -> List[Dict]:
-        """Get articles sorted by absolute price change."""
-        connection = self._get_connection()
-        try:
-            with connection.cursor() as cursor:
-                cursor.execute(
-                    """SELECT
-                        ri.title, ri.published_at, ri.stock_tickers,
-                        ass.ticker, ass.price_at_publication,
-                        ass.price_current AS price_next_day,
-                        ass.price_change_since_article AS change_pct
-                    FROM article_stock_snapshots ass
-                    JOIN rss_items ri ON ass.article_id = ri.id
-                    WHERE ass.price_at_publication IS NOT NULL
-                      AND ass.price_change_since_article IS NOT NULL
-                    ORDER BY ABS(ass.price_change_since_article) DESC
-                    LIMIT %s""",
-                    (limit,)
-                )
-                return cursor.fetchall()
-        finally:
-            connection.close()
+    def _get_report_data(self, impact_limit: int = 20,
+                         volume_limit: int = 15) -> Tuple[List[Dict], List[Dict], Dict]:
+        """
+        Fetch all report data in a single round-trip.
 
-    def _get_volume_data(self, limit: int = 15) -> List[Dict]:
-        """Get articles with unusual volume activity."""
-        connection = self._get_connection()
-        try:
-            with connection.cursor() as cursor:
-                cursor.execute(
-                    """SELECT
-                        ri.title, ri.published_at,
-                        ass.ticker,
-                        sp_news.volume AS news_volume,
-                        sp_news.close_price,
-                        sp_news.change_percent,
-                        (SELECT AVG(sp2.volume) FROM stock_prices sp2
-                         WHERE sp2.ticker = ass.ticker) AS avg_volume
-                    FROM article_stock_snapshots ass
-                    JOIN rss_items ri ON ass.article_id = ri.id
-                    LEFT JOIN stock_prices sp_news ON sp_news.ticker = ass.ticker
-                        AND sp_news.price_date = (
-                            SELECT MIN(sp3.price_date) FROM stock_prices sp3
-                            WHERE sp3.ticker = ass.ticker
-                              AND sp3.price_date >= DATE(ri.published_at)
-                        )
-                    WHERE sp_news.volume IS NOT NULL
-                      AND sp_news.volume > 0
-                    ORDER BY (sp_news.volume / NULLIF(
-                        (SELECT AVG(sp4.volume) FROM stock_prices sp4
-                         WHERE sp4.ticker = ass.ticker), 0)) DESC
-                    LIMIT %s""",
-                    (limit,)
-                )
-                return cursor.fetchall()
-        finally:
-            connection.close()
+        The price impact, volume and summary queries are sent as one
+        multi-statement batch and read back result set by result set.
 
-    def _get_summary_stats(self) -> Dict:
-        """Get summary statistics for the report."""
-        connection = self._get_connection()
+        Returns:
+            Tuple of (price impact rows, volume rows, summary stats)
+        """
+        connection = self._get_connection(client_flag=CLIENT.MULTI_STATEMENTS)
         try:
             with connection.cursor() as cursor:
                 cursor.execute(
-                    """SELECT
-                        COUNT(*) AS total_snapshots,
-                        SUM(CASE WHEN price_change_since_article > 0 THEN 1 ELSE 0 END) AS positive,
-                        SUM(CASE WHEN price_change_since_article < 0 THEN 1 ELSE 0 END) AS negative,
-                        SUM(CASE WHEN price_change_since_article = 0 THEN 1 ELSE 0 END) AS neutral,
-                        AVG(price_change_since_article) AS avg_change,
-                        MAX(price_change_since_article) AS max_gain,
-                        MIN(price_change_since_article) AS max_loss
-                    FROM article_stock_snapshots
-                    WHERE price_change_since_article IS NOT NULL"""
+                    ';\n'.join((self.PRICE_IMPACT_SQL, self.VOLUME_SQL,
+                                self.SUMMARY_STATS_SQL)),
+                    (impact_limit, volume_limit)
                 )
-                return cursor.fetchone()
+                impact_data = cursor.fetchall()
+                cursor.nextset()
+                volume_data = cursor.fetchall()
+                cursor.nextset()
+                stats = cursor.fetchone()
+                return impact_data, volume_data, stats
         finally:
             connection.close()
 
@@ -139,12 +232,44 @@ class TelegramReportService:
     # PDF generation
     # ------------------------------------------------------------------
 
-    def generate_pdf(self) -> bytes:
+    @staticmethod
+    def _render_table(pdf: FPDF, columns: tuple, rows: List[tuple]):
+        """
+        Render a bordered table from pre-formatted rows.
+
+        Args:
+            pdf: FPDF document to draw on
+            columns: (header, width, align) tuple per column
+            rows: Tuples of already-formatted cell strings
+        """
+        pdf.set_font('Helvetica', 'B', 8)
+        for header, width, align in columns:
+            pdf.cell(width, 7, header, border=1, align=align)
+        pdf.ln()
+
+        pdf.set_font('Helvetica', '', 7)
+        for row in rows:
+            for (_, width, align), value in zip(columns, row):
+                pdf.cell(width, 6, value, border=1, align=align)
+            pdf.ln()
+
+    @staticmethod
+    def _report_key(impact_data: List[Dict], volume_data: List[Dict], stats: Dict) -> str:
+        """Hash the report data so unchanged reports can be recognised."""
+        payload = json.dumps([impact_data, volume_data, stats], default=str, sort_keys=True)
+        return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+    def generate_pdf(self, now: datetime = None) -> bytes:
         """Generate a PDF report with news impact analysis."""
-        now = datetime.now()
-        impact_data = self._get_price_impact_data(limit=20)
-        volume_data = self._get_volume_data(limit=15)
-        stats = self._get_summary_stats()
+        impact_data, volume_data, stats = self._get_report_data(
+            impact_limit=20, volume_limit=15
+        )
+        return self._build_pdf(impact_data, volume_data, stats, now=now)
+
+    def _build_pdf(self, impact_data: List[Dict], volume_data: List[Dict],
+                   stats: Dict, now: datetime = None) -> bytes:
+        """Render the report PDF from already-fetched data."""
+        now = now or datetime.now()
 
         pdf = FPDF()
         pdf.set_auto_page_break(auto=True, margin=15)
@@ -190,34 +315,21 @@ class TelegramReportService:
         pdf.cell(0, 10, 'Top Price Movers', new_x='LMARGIN', new_y='NEXT')
 
         if impact_data:
-            # Table header
-            col_w = [18, 20, 28, 28, 96]
-            pdf.set_font('Helvetica', 'B', 8)
-            pdf.cell(col_w[0], 7, 'Ticker', border=1)
-            pdf.cell(col_w[1], 7, 'Change %', border=1, align='R')
-            pdf.cell(col_w[2], 7, 'Pub Price', border=1, align='R')
-            pdf.cell(col_w[3], 7, 'Next Day', border=1, align='R')
-            pdf.cell(col_w[4], 7, 'Article Title', border=1)
-            pdf.ln()
-
-            pdf.set_font('Helvetica', '', 7)
+            rows = []
             for row in impact_data:
                 change = float(row['change_pct'] or 0)
-                pub_price = float(row['price_at_publication'] or 0)
-                next_price = float(row['price_next_day'] or 0)
-                title = (row['title'] or '')[:60]
-                # Sanitize for PDF (remove non-latin1 chars)
-                title = title.encode('latin-1', 'replace').decode('latin-1')
-                ticker = str(row['ticker'] or '')
-
                 arrow = '+' if change >= 0 else ''
 
-                pdf.cell(col_w[0], 6, ticker, border=1)
-                pdf.cell(col_w[1], 6, f'{arrow}{change:.2f}%', border=1, align='R')
-                pdf.cell(col_w[2], 6, f'${pub_price:.2f}', border=1, align='R')
-                pdf.cell(col_w[3], 6, f'${next_price:.2f}', border=1, align='R')
-                pdf.cell(col_w[4], 6, title, border=1)
-                pdf.ln()
+                rows.append((
+                    str(row['ticker'] or ''),
+                    f'{arrow}{change:.2f}%',
+                    f"${float(row['price_at_publication'] or 0):.2f}",
+                    f"${float(row['price_next_day'] or 0):.2f}",
+                    # Sanitize for PDF (replace non-latin1 chars)
+                    (row['title'] or '')[:60].translate(_LATIN1_TABLE),
+                ))
+
+            self._render_table(pdf, _IMPACT_COLUMNS, rows)
         else:
             pdf.set_font('Helvetica', '', 10)
             pdf.cell(0, 6, 'No price impact data available.',
@@ -231,35 +343,23 @@ class TelegramReportService:
                  new_x='LMARGIN', new_y='NEXT')
 
         if volume_data:
-            col_w = [18, 28, 28, 20, 20, 76]
-            pdf.set_font('Helvetica', 'B', 8)
-            pdf.cell(col_w[0], 7, 'Ticker', border=1)
-            pdf.cell(col_w[1], 7, 'News Vol', border=1, align='R')
-            pdf.cell(col_w[2], 7, 'Avg Vol', border=1, align='R')
-            pdf.cell(col_w[3], 7, 'Ratio', border=1, align='R')
-            pdf.cell(col_w[4], 7, 'Price %', border=1, align='R')
-            pdf.cell(col_w[5], 7, 'Article Title', border=1)
-            pdf.ln()
-
-            pdf.set_font('Helvetica', '', 7)
+            rows = []
             for row in volume_data:
                 news_vol = int(row['news_volume'] or 0)
                 avg_vol = int(row['avg_volume'] or 1)
                 ratio = news_vol / avg_vol if avg_vol > 0 else 0
-                change = float(row['change_percent'] or 0)
-                title = (row['title'] or '')[:48]
-                title = title.encode('latin-1', 'replace').decode('latin-1')
-                ticker = str(row['ticker'] or '')
-
                 signal = ' !!!' if ratio > 2.0 else ' !' if ratio > 1.5 else ''
 
-                pdf.cell(col_w[0], 6, ticker, border=1)
-                pdf.cell(col_w[1], 6, f'{news_vol:,}', border=1, align='R')
-                pdf.cell(col_w[2], 6, f'{avg_vol:,}', border=1, align='R')
-                pdf.cell(col_w[3], 6, f'{ratio:.1f}x{signal}', border=1, align='R')
-                pdf.cell(col_w[4], 6, f'{change:+.2f}%', border=1, align='R')
-                pdf.cell(col_w[5], 6, title, border=1)
-                pdf.ln()
+                rows.append((
+                    str(row['ticker'] or ''),
+                    f'{news_vol:,}',
+                    f'{avg_vol:,}',
+                    f'{ratio:.1f}x{signal}',
+                    f"{float(row['change_percent'] or 0):+.2f}%",
+                    (row['title'] or '')[:48].translate(_LATIN1_TABLE),
+                ))
+
+            self._render_table(pdf, _VOLUME_COLUMNS, rows)
 
             pdf.ln(3)
             pdf.set_font('Helvetica', 'I', 7)
@@ -283,8 +383,21 @@ class TelegramReportService:
     # Telegram sending
     # ------------------------------------------------------------------
 
+    def _open_telegram_connection(self) -> Optional[HTTPSConnection]:
+        """Open a TLS connection to the Bot API ahead of an upload."""
+        connection = HTTPSConnection(urlsplit(self.TELEGRAM_API_URL).netloc, timeout=30)
+        try:
+            connection.connect()
+        except OSError as e:
+            logger.warning(f"Could not pre-open Telegram connection: {e}")
+            connection.close()
+            return None
+        return connection
+
     def send_telegram_document(self, pdf_bytes: bytes, filename: str = None,
-                                caption: str = None) -> Dict:
+                                caption: str = None,
+                                connection: HTTPSConnection = None,
+                                now: datetime = None) -> Dict:
         """
         Send a PDF document to Telegram via Bot API.
 
@@ -292,6 +405,9 @@ class TelegramReportService:
             pdf_bytes: PDF file content as bytes
             filename: Filename for the document
             caption: Optional caption text
+            connection: Already-open connection to api.telegram.org to send
+                on (a new one is opened and closed if omitted)
+            now: Timestamp for the default filename (defaults to current time)
 
         Returns:
             Telegram API response dict
@@ -300,39 +416,52 @@ class TelegramReportService:
             raise ValueError("TELEGRAM_BOT_TOKEN and TELEGRAM_CHAT_ID must be set")
 
         if not filename:
-            filename = f"news_impact_{datetime.now().strftime('%Y%m%d_%H%M')}.pdf"
+            filename = f"news_impact_{(now or datetime.now()).strftime('%Y%m%d_%H%M')}.pdf"
 
         url = f"{self.TELEGRAM_API_URL.format(token=self.bot_token)}/sendDocument"
 
-        # Build multipart form data
+        # Build multipart form data. The PDF is sent as its own chunk
+        # (http.client streams iterable bodies) rather than being copied
+        # into one concatenated body.
         boundary = '----FormBoundary7MA4YWxkTrZu0gW'
-        body = b''
+        head = ''
 
         # chat_id field
-        body += f'--{boundary}\r\n'.encode()
-        body += f'Content-Disposition: form-data; name="chat_id"\r\n\r\n'.encode()
-        body += f'{self.chat_id}\r\n'.encode()
+        head += f'--{boundary}\r\n'
+        head += f'Content-Disposition: form-data; name="chat_id"\r\n\r\n'
+        head += f'{self.chat_id}\r\n'
 
         # caption field
         if caption:
-            body += f'--{boundary}\r\n'.encode()
-            body += f'Content-Disposition: form-data; name="caption"\r\n\r\n'.encode()
-            body += f'{caption}\r\n'.encode()
+            head += f'--{boundary}\r\n'
+            head += f'Content-Disposition: form-data; name="caption"\r\n\r\n'
+            head += f'{caption}\r\n'
 
         # document field
-        body += f'--{boundary}\r\n'.encode()
-        body += (f'Content-Disposition: form-data; name="document"; '
-                 f'filename="{filename}"\r\n').encode()
-        body += f'Content-Type: application/pdf\r\n\r\n'.encode()
-        body += pdf_bytes
-        body += f'\r\n--{boundary}--\r\n'.encode()
+        head += f'--{boundary}\r\n'
+        head += (f'Content-Disposition: form-data; name="document"; '
+                 f'filename="{filename}"\r\n')
+        head += f'Content-Type: application/pdf\r\n\r\n'
+
+        body = (head.encode(), pdf_bytes, f'\r\n--{boundary}--\r\n'.encode())
+
+        headers = {
+            'Content-Type': f'multipart/form-data; boundary={boundary}',
+            'Content-Length': str(sum(len(part) for part in body)),
+        }
 
-        req = Request(url, data=body, method='POST')
-        req.add_header('Content-Type', f'multipart/form-data; boundary={boundary}')
+        owns_connection = connection is None
+        if owns_connection:
+            connection = HTTPSConnection(urlsplit(url).netloc, timeout=30)
 
         try:
-            response = urlopen(req, timeout=30)
-            result = json.loads(response.read().decode('utf-8'))
+            with _telegram_send_slot(self.chat_id):
+                connection.request('POST', urlsplit(url).path, body=body, headers=headers)
+                response = connection.getresponse()
+            if response.status >= 400:
+                raise HTTPError(url, response.status, response.reason,
+                                response.headers, response)
+            result = _json_loads(response.read())
             logger.info(f"Telegram document sent successfully")
             return result
         except HTTPError as e:
@@ -342,6 +471,9 @@ class TelegramReportService:
         except Exception as e:
             logger.error(f"Error sending to Telegram: {e}")
             raise
+        finally:
+            if owns_connection:
+                connection.close()
 
     def send_telegram_message(self, text: str) -> Dict:
         """Send a plain text message to Telegram."""
@@ -349,33 +481,66 @@ class TelegramReportService:
             raise ValueError("TELEGRAM_BOT_TOKEN and TELEGRAM_CHAT_ID must be set")
 
         url = f"{self.TELEGRAM_API_URL.format(token=self.bot_token)}/sendMessage"
-        payload = json.dumps({
+        payload = _json_dumps({
             'chat_id': self.chat_id,
             'text': text,
             'parse_mode': 'HTML'
-        }).encode('utf-8')
+        })
 
         req = Request(url, data=payload, method='POST')
         req.add_header('Content-Type', 'application/json')
 
-        response = urlopen(req, timeout=15)
-        return json.loads(response.read().decode('utf-8'))
+        with _telegram_send_slot(self.chat_id):
+            response = urlopen(req, timeout=15)
+        return _json_loads(response.read())
 
     # ------------------------------------------------------------------
     # Main entry point
     # ------------------------------------------------------------------
 
-    def generate_and_send_report(self) -> Dict:
-        """Generate the PDF report and send it to Telegram."""
-        logger.info("Generating news impact PDF report...")
-        pdf_bytes = self.generate_pdf()
-        logger.info(f"PDF generated: {len(pdf_bytes)} bytes")
+    def generate_and_send_report(self, force: bool = False) -> Dict:
+        """
+        Generate the PDF report and send it to Telegram.
 
+        If the same report data was already sent to this chat within
+        REPORT_CACHE_TTL, the upload is skipped unless force is set.
+        """
         now = datetime.now()
+        logger.info("Generating news impact PDF report...")
+        impact_data, volume_data, stats = self._get_report_data(
+            impact_limit=20, volume_limit=15
+        )
+        report_key = self._report_key(impact_data, volume_data, stats)
+
         filename = f"news_impact_{now.strftime('%Y%m%d_%H%M')}.pdf"
         caption = f"News Impact Report - {now.strftime('%Y-%m-%d %H:%M')}"
 
-        result = self.send_telegram_document(pdf_bytes, filename=filename, caption=caption)
+        sent_at = _SENT_REPORTS.get((report_key, self.chat_id))
+        if not force and sent_at and time.time() - sent_at < self.REPORT_CACHE_TTL:
+            logger.info("Report data unchanged since last send, skipping Telegram upload")
+            return {
+                'status': 'success',
+                'skipped': True,
+                'reason': 'report unchanged since last send',
+                'last_sent_at': datetime.fromtimestamp(sent_at).isoformat(),
+            }
+
+        # Do the Telegram TCP/TLS handshake in the background while the PDF renders
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pending_connection = executor.submit(self._open_telegram_connection)
+            pdf_bytes = self._build_pdf(impact_data, volume_data, stats, now=now)
+            connection = pending_connection.result()
+        logger.info(f"PDF generated: {len(pdf_bytes)} bytes")
+
+        try:
+            result = self.send_telegram_document(pdf_bytes, filename=filename,
+                                                 caption=caption, connection=connection,
+                                                 now=now)
+        finally:
+            if connection is not None:
+                connection.close()
+        if result.get('ok'):
+            _SENT_REPORTS[(report_key, self.chat_id)] = time.time()
 
         return {
             'status': 'success',
@@ -212,10 +212,10 @@ class TickerRelevanceService:
                 if not article or not article['stock_tickers']:
                     return
 
-                tickers = [t.strip() for t in article['stock_tickers'].split(',') if t.strip()]
+                tickers = [t for t in map(str.strip, article['stock_tickers'].split(',')) if t]
                 company_names = []
                 if article['company_names']:
-                    company_names = [c.strip() for c in article['company_names'].split(',') if c.strip()]
+                    company_names = [c for c in map(str.strip, article['company_names'].split(',')) if c]
 
                 # Compute relevance scores
                 scores = self.compute_relevance_scores(
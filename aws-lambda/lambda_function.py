@@ -21,11 +21,15 @@ Environment Variables Required:
 import json
 import logging
 import os
+import re
+from datetime import datetime
 from typing import Dict, Any, List
 
 import pymysql
 
-from services import BloombergService, FiercebiotechService, CompanyExtractor, KeywordAlertService
+from services import (
+    BaseRSSService, BloombergService, FiercebiotechService, CompanyExtractor, KeywordAlertService
+)
 
 # Configure logging
 logger = logging.getLogger()
@@ -73,10 +77,14 @@ def fetch_fiercebiotech_feed(db_config: Dict[str, str]) -> Dict[str, Any]:
 
 def fetch_all_feeds(db_config: Dict[str, str]) -> Dict[str, Any]:
     """Fetch all RSS feeds, then extract tickers from new articles."""
-    results = {
-        'bloomberg': fetch_bloomberg_feed(db_config),
-        'fiercebiotech': fetch_fiercebiotech_feed(db_config)
+    # Both feeds download concurrently; items are saved one feed at a time
+    sources = {
+        'bloomberg': BloombergService(db_config),
+        'fiercebiotech': FiercebiotechService(db_config)
     }
+    results = dict(zip(sources, BaseRSSService.fetch_and_save_all(list(sources.values()))))
+    for source, result in results.items():
+        logger.info(f"{source} fetch result: {result}")
 
     # Auto-extract tickers from newly fetched articles
     ticker_result = extract_tickers(db_config, {'limit': 50})
@@ -133,16 +141,23 @@ def extract_tickers(db_config: Dict[str, str], params: Dict[str, Any] = None) ->
         if not articles:
             return {'status': 'success', 'message': 'No articles to process', 'processed': 0}
 
-        updated = 0
-        for idx, article in enumerate(articles):
+        texts = []
+        for article in articles:
             text = article['title'] or ''
             if article.get('summary'):
                 text = f"{text}. {article['summary']}"
+            texts.append(text)
+
+        # Run NER over all articles in batches
+        results = extractor.extract_many(texts)
 
+        updated = 0
+        updated_ids = []
+        ticker_rows = []
+        for idx, (article, result) in enumerate(zip(articles, results)):
             logger.info(f"[DEBUG] extract_tickers [{idx}] id={article['id']} "
                         f"title={str(article.get('title', ''))[:80]}")
 
-            result = extractor.extract_companies_and_tickers(text)
             tickers_str, companies_str = extractor.format_for_database(result)
 
             logger.info(f"[DEBUG] extract_tickers [{idx}] "
@@ -161,6 +176,8 @@ def extract_tickers(db_config: Dict[str, str], params: Dict[str, Any] = None) ->
                         (tickers_str, companies_str, article['id'])
                     )
                     updated += 1
+                    updated_ids.append(article['id'])
+                    ticker_rows.extend((article['id'], t) for t in result['tickers'])
                     logger.info(f"[DEBUG] extract_tickers [{idx}] UPDATED article {article['id']} "
                                 f"with tickers={tickers_str}")
                 else:
@@ -173,6 +190,19 @@ def extract_tickers(db_config: Dict[str, str], params: Dict[str, Any] = None) ->
                     logger.info(f"[DEBUG] extract_tickers [{idx}] SKIPPED article {article['id']} "
                                 f"(no tickers found, marked as processed)")
 
+        if ticker_rows:
+            with connection.cursor() as cursor:
+                # Replace, not merge, so tickers dropped on re-extraction stop matching
+                placeholders = ', '.join(['%s'] * len(updated_ids))
+                cursor.execute(
+                    f"DELETE FROM rss_item_tickers WHERE item_id IN ({placeholders})",
+                    updated_ids
+                )
+                cursor.executemany(
+                    "INSERT IGNORE INTO rss_item_tickers (item_id, ticker) VALUES (%s, %s)",
+                    ticker_rows
+                )
+
         connection.commit()
         logger.info(f"Extracted tickers for {updated}/{len(articles)} articles")
 
@@ -322,11 +352,58 @@ def process_existing_articles(db_config: Dict[str, str], params: Dict[str, Any]
 # Search
 # ---------------------------------------------------------------------------
 
+# InnoDB does not index words shorter than innodb_ft_min_token_size (default 3)
+_FULLTEXT_MIN_WORD_LEN = 3
+# InnoDB's default stopword list (INFORMATION_SCHEMA.INNODB_FT_DEFAULT_STOPWORD).
+# These are not indexed, so a required '+the*' term would match nothing.
+_FULLTEXT_STOPWORDS = frozenset((
+    'a', 'about', 'an', 'are', 'as', 'at', 'be', 'by', 'com', 'de', 'en',
+    'for', 'from', 'how', 'i', 'in', 'is', 'it', 'la', 'of', 'on', 'or',
+    'that', 'the', 'this', 'to', 'was', 'what', 'when', 'where', 'who',
+    'will', 'with', 'und', 'www',
+))
+# InnoDB's parser splits on anything that is not a letter, digit or '_', so
+# this also drops BOOLEAN MODE operator characters from the search string
+_FULLTEXT_TOKEN_RE = re.compile(r'\w+')
+
+
+def _fulltext_query(keyword: str) -> str:
+    """
+    Build a BOOLEAN MODE search string requiring every word of the keyword.
+
+    The keyword is split into words the way InnoDB tokenizes it, so
+    "AT&T" becomes 'AT' and 'T'. Each word becomes '+word*' so all words
+    must be present, matching as prefixes. Stopwords are left out, since
+    they are not indexed. Returns '' if any other word is too short to be
+    in the index, or if only stopwords remain, in which case the caller
+    should fall back to LIKE.
+    """
+    words = [
+        w for w in _FULLTEXT_TOKEN_RE.findall(keyword)
+        if w.lower() not in _FULLTEXT_STOPWORDS
+    ]
+    if not words or any(len(w) < _FULLTEXT_MIN_WORD_LEN for w in words):
+        return ''
+    return ' '.join(f'+{w}*' for w in words)
+
+
 def search_news(db_config: Dict[str, str], params: Dict[str, Any]) -> Dict[str, Any]:
     """
     Search news items in the database.
 
-    Params: keyword, source, limit, offset, date_from, date_to, ticker
+    Params: keyword, source, limit, offset, date_from, date_to, ticker, cursor
+
+    keyword uses the FULLTEXT index: every word must appear in the title,
+    summary or content, matched as a word prefix ("pharma" finds
+    "pharmaceutical" but not "biopharma"), and stopwords such as "the" or
+    "of" are ignored. Keywords with words shorter than 3 characters, or made
+    up only of stopwords, fall back to a plain substring (LIKE) match.
+
+    For deep paging, pass the previous response's next_cursor as cursor
+    ({'published_at': ..., 'id': ...}) instead of offset; the query then
+    seeks straight to the next page rather than skipping offset rows.
+    Items without published_at sort last (MySQL puts NULLs last in DESC
+    order); once the dated items run out they are paged by id alone.
     """
     connection = None
     try:
@@ -354,9 +431,15 @@ def search_news(db_config: Dict[str, str], params: Dict[str, Any]) -> Dict[str,
             query_params = []
 
             if params.get('keyword'):
-                query += " AND (i.title LIKE %s OR i.summary LIKE %s OR i.content LIKE %s)"
-                keyword = f"%{params['keyword']}%"
-                query_params.extend([keyword, keyword, keyword])
+                fulltext = _fulltext_query(params['keyword'])
+                if fulltext:
+                    # Uses the ft_items FULLTEXT index (migration 011)
+                    query += " AND MATCH(i.title, i.summary, i.content) AGAINST (%s IN BOOLEAN MODE)"
+                    query_params.append(fulltext)
+                else:
+                    query += " AND (i.title LIKE %s OR i.summary LIKE %s OR i.content LIKE %s)"
+                    keyword = f"%{params['keyword']}%"
+                    query_params.extend([keyword, keyword, keyword])
 
             if params.get('source'):
                 query += " AND f.title LIKE %s"
@@ -371,18 +454,47 @@ def search_news(db_config: Dict[str, str], params: Dict[str, Any]) -> Dict[str,
                 query_params.append(params['date_to'])
 
             if params.get('ticker'):
-                query += " AND FIND_IN_SET(%s, i.stock_tickers) > 0"
+                # Index seek on rss_item_tickers (ticker, item_id), migration 012
+                query += " AND i.id IN (SELECT item_id FROM rss_item_tickers WHERE ticker = %s)"
                 query_params.append(params['ticker'])
 
-            query += " ORDER BY i.published_at DESC"
-
-            limit = int(params.get('limit', 50))
-            offset = int(params.get('offset', 0))
-            query += " LIMIT %s OFFSET %s"
-            query_params.extend([limit, offset])
-
-            cursor.execute(query, query_params)
-            results = cursor.fetchall()
+            limit = max(int(params.get('limit', 50)), 1)
+            page_cursor = params.get('cursor')
+            if not page_cursor:
+                offset = int(params.get('offset', 0))
+                cursor.execute(
+                    query + " ORDER BY i.published_at DESC, i.id DESC LIMIT %s OFFSET %s",
+                    query_params + [limit, offset]
+                )
+                results = list(cursor.fetchall())
+            else:
+                results = []
+                tail_after_id = None
+                if page_cursor.get('published_at'):
+                    # Range scan on idx_published_at, which InnoDB extends
+                    # with the primary key, so it is (published_at, id)
+                    published_at = datetime.fromisoformat(page_cursor['published_at'])
+                    cursor.execute(
+                        query + " AND (i.published_at < %s"
+                                " OR (i.published_at = %s AND i.id < %s))"
+                                " ORDER BY i.published_at DESC, i.id DESC LIMIT %s",
+                        query_params + [published_at, published_at,
+                                        int(page_cursor['id']), limit]
+                    )
+                    results = list(cursor.fetchall())
+                else:
+                    tail_after_id = int(page_cursor['id'])
+
+                # Undated items come after all dated ones; page them by id
+                if len(results) < limit and not (params.get('date_from') or params.get('date_to')):
+                    tail_query = query + " AND i.published_at IS NULL"
+                    tail_params = list(query_params)
+                    if tail_after_id is not None:
+                        tail_query += " AND i.id < %s"
+                        tail_params.append(tail_after_id)
+                    cursor.execute(tail_query + " ORDER BY i.id DESC LIMIT %s",
+                                   tail_params + [limit - len(results)])
+                    results.extend(cursor.fetchall())
 
             for result in results:
                 if result.get('published_at'):
@@ -392,10 +504,16 @@ def search_news(db_config: Dict[str, str], params: Dict[str, Any]) -> Dict[str,
                 if result.get('created_at'):
                     result['created_at'] = result['created_at'].isoformat()
 
+            next_cursor = None
+            if results and len(results) == limit:
+                last = results[-1]
+                next_cursor = {'published_at': last['published_at'], 'id': last['id']}
+
             return {
                 'status': 'success',
                 'count': len(results),
-                'items': results
+                'items': results,
+                'next_cursor': next_cursor
             }
 
     except Exception as e:
@@ -5,13 +5,92 @@ Base RSS Service class for fetching and parsing RSS feeds
 import feedparser
 import hashlib
 import logging
+import re
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from email.utils import parsedate_to_datetime
+from typing import Dict, List, Optional, Any, Tuple
 import pymysql
 from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from html.parser import HTMLParser
+from dateutil import parser as dateutil_parser
+
+from .keyword_alert_service import KeywordAlertService
+
+try:
+    from lxml import html as lxml_html
+except ImportError:
+    lxml_html = None
 
 logger = logging.getLogger(__name__)
 
+# RFC 822 dates as used in RSS pubDate: "Thu, 05 Feb 2026 16:54:00 GMT"
+_RFC822_RE = re.compile(
+    r'(?:[A-Za-z]{3},\s*)?\d{1,2}\s+[A-Za-z]{3}\s+\d{2,4}\s+\d{1,2}:\d{2}(?::\d{2})?\s+'
+    r'(?:[+-]\d{4}|GMT|UTC?|[ECMP][SD]T|Z)\s*$',
+    re.IGNORECASE
+)
+
+# Open connections by DB config, reused across warm Lambda invocations
+_CONNECTIONS = {}
+
+# Known feed date layouts tried with strptime before the generic dateutil parser
+_DATE_FORMATS = (
+    '%b %d, %Y %I:%M%p',    # Fierce Biotech: "Feb 5, 2026 4:54am"
+    '%b %d, %Y %I:%M %p',
+    '%b %d, %Y',
+)
+
+# rss_feeds UPDATE statements for update_feed_metadata, keyed by
+# (has_feed_info, has_etag, has_modified)
+_FEED_UPDATE_SQL = {
+    (info, etag, modified): (
+        "UPDATE rss_feeds SET last_fetch_at = %s, next_fetch_at = %s"
+        + (", title = %s, site_url = %s, description = %s, language = %s" if info else "")
+        + (", etag = %s" if etag else "")
+        + (", last_modified = %s" if modified else "")
+        + " WHERE id = %s"
+    )
+    for info in (False, True)
+    for etag in (False, True)
+    for modified in (False, True)
+}
+
+# rss_items VARCHAR column widths (migration 001). Values are cut to fit
+# before INSERT IGNORE, which would otherwise truncate them silently and
+# leave the stored GUID different from the one used to look the row up.
+_ITEM_FIELD_LIMITS = {
+    'guid': 500,
+    'link': 1000,
+    'title': 500,
+    'author': 255,
+    'image_url': 1000,
+}
+
+
+@lru_cache(maxsize=16384)
+def _word_pattern(phrase: str) -> re.Pattern:
+    """Compiled whole-word pattern for phrase, kept across feeds and invocations"""
+    return re.compile(r'\b' + re.escape(phrase) + r'\b')
+
+
+class _MLStripper(HTMLParser):
+    """Collect the text content of an HTML fragment (used when lxml is not installed)"""
+
+    def __init__(self):
+        super().__init__()
+        self.reset()
+        self.strict = False
+        self.convert_charrefs = True
+        self.text = []
+
+    def handle_data(self, d):
+        self.text.append(d)
+
+    def get_data(self):
+        return ''.join(self.text)
+
 
 class BaseRSSService(ABC):
     """
@@ -53,27 +132,66 @@ class BaseRSSService(ABC):
         """
         pass
 
+    @staticmethod
+    def get_entry_guid(item: Any) -> str:
+        """
+        Return the GUID a feed entry is stored under
+
+        parse_item implementations use this for the 'guid' field, so stored
+        entries can be recognised before they are parsed.
+
+        Args:
+            item: RSS feed item from feedparser
+
+        Returns:
+            str: Entry id, falling back to its link, cut to the guid column width
+        """
+        return (item.get('id') or item.get('link', ''))[:_ITEM_FIELD_LIMITS['guid']]
+
     def get_db_connection(self):
         """
-        Create and return a database connection
+        Return the database connection shared by services with the same config
+
+        The connection is kept open across warm Lambda invocations and
+        reconnected if the server has dropped it.
 
         Returns:
             pymysql.Connection: Database connection object
         """
-        return pymysql.connect(
-            host=self.db_config['host'],
-            user=self.db_config['user'],
-            password=self.db_config['password'],
-            database=self.db_config['database'],
-            port=int(self.db_config.get('port', 3306)),
-            charset='utf8mb4',
-            cursorclass=pymysql.cursors.DictCursor
-        )
+        key = tuple(sorted(self.db_config.items()))
+        connection = _CONNECTIONS.get(key)
+        if connection is None or not connection.open:
+            connection = pymysql.connect(
+                host=self.db_config['host'],
+                user=self.db_config['user'],
+                password=self.db_config['password'],
+                database=self.db_config['database'],
+                port=int(self.db_config.get('port', 3306)),
+                charset='utf8mb4',
+                cursorclass=pymysql.cursors.DictCursor
+            )
+            _CONNECTIONS[key] = connection
+        else:
+            connection.ping(reconnect=True)
+        return connection
+
+    def discard_db_connection(self):
+        """Close and forget the shared connection, e.g. after it failed to reset"""
+        connection = _CONNECTIONS.pop(tuple(sorted(self.db_config.items())), None)
+        if connection is not None:
+            try:
+                connection.close()
+            except pymysql.MySQLError:
+                pass  # already broken
 
     def get_or_create_feed(self, connection) -> int:
         """
         Get or create the RSS feed record in the database
 
+        A new feed record is committed straight away. The connection is shared
+        by all feeds, so leaving it open would let another feed's rollback
+        discard it.
+
         Args:
             connection: Database connection
 
@@ -101,10 +219,31 @@ class BaseRSSService(ABC):
                 """,
                 (feed_url, self.feed_title, True, datetime.now())
             )
-            connection.commit()
-            return cursor.lastrowid
+            feed_id = cursor.lastrowid
+        connection.commit()
+        return feed_id
 
-    def update_feed_metadata(self, connection, feed_id: int, feed_data: Any):
+    def get_feed_validators(self, connection, feed_id: int) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Get the ETag and Last-Modified values stored from the previous fetch
+
+        Args:
+            connection: Database connection
+            feed_id: Feed ID
+
+        Returns:
+            Tuple of (etag, last_modified), either of which may be None
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT etag, last_modified FROM rss_feeds WHERE id = %s",
+                (feed_id,)
+            )
+            result = cursor.fetchone() or {}
+            return result.get('etag'), result.get('last_modified')
+
+    def update_feed_metadata(self, connection, feed_id: int, feed_data: Any,
+                             save_validators: bool = True):
         """
         Update feed metadata from parsed feed
 
@@ -112,109 +251,200 @@ class BaseRSSService(ABC):
             connection: Database connection
             feed_id: Feed ID
             feed_data: Parsed feed data from feedparser
+            save_validators: Store the response's etag/last_modified. Pass
+                             False when some entries were not saved, so the
+                             next fetch gets the full feed instead of a 304.
         """
-        with connection.cursor() as cursor:
+        now = datetime.now()
+        params = [now, now + timedelta(minutes=60)]
+
+        # A 304 response has no feed body, so keep the stored metadata
+        has_info = feed_data.get('status') != 304
+        if has_info:
             feed_info = feed_data.get('feed', {})
+            params += [
+                feed_info.get('title', self.feed_title),
+                feed_info.get('link'),
+                feed_info.get('description'),
+                feed_info.get('language'),
+            ]
+
+        # Handle etag and last_modified if present
+        etag = save_validators and feed_data.get('etag')
+        if etag:
+            params.append(etag)
+        modified = save_validators and feed_data.get('modified')
+        if modified:
+            params.append(modified)
+        params.append(feed_id)
 
-            update_data = {
-                'title': feed_info.get('title', self.feed_title),
-                'site_url': feed_info.get('link'),
-                'description': feed_info.get('description'),
-                'language': feed_info.get('language'),
-                'last_fetch_at': datetime.now(),
-                'next_fetch_at': datetime.now() + timedelta(minutes=60)
-            }
+        with connection.cursor() as cursor:
+            cursor.execute(_FEED_UPDATE_SQL[has_info, bool(etag), bool(modified)], params)
 
-            # Handle etag and last_modified if present
-            if hasattr(feed_data, 'etag'):
-                update_data['etag'] = feed_data.etag
-            if hasattr(feed_data, 'modified'):
-                update_data['last_modified'] = feed_data.modified
+    def get_existing_guids(self, connection, feed_id: int, guids: List[str]) -> set:
+        """
+        Find which of the given GUIDs are already stored for a feed
 
-            # Build update query
-            update_fields = ', '.join([f"{k} = %s" for k in update_data.keys()])
+        Args:
+            connection: Database connection
+            feed_id: Feed ID
+            guids: Item GUIDs to look up
+
+        Returns:
+            Set of GUIDs that already exist in rss_items
+        """
+        if not guids:
+            return set()
+
+        with connection.cursor() as cursor:
+            placeholders = ', '.join(['%s'] * len(guids))
             cursor.execute(
-                f"UPDATE rss_feeds SET {update_fields} WHERE id = %s",
-                (*update_data.values(), feed_id)
+                f"SELECT guid FROM rss_items WHERE feed_id = %s AND guid IN ({placeholders})",
+                (feed_id, *guids)
             )
-            connection.commit()
+            return {row['guid'] for row in cursor.fetchall()}
 
-    def save_item(self, connection, feed_id: int, item_data: Dict[str, Any]) -> Optional[int]:
+    def save_items_bulk(self, connection, feed_id: int, items: List[Dict[str, Any]]) -> Dict[str, int]:
         """
-        Save a single RSS item to the database
+        Save RSS items to the database in a single batch
+
+        Rows are written with one executemany INSERT IGNORE; items whose GUID
+        is already stored are skipped by the unique key. If the batch fails,
+        it is retried row by row so one bad item cannot drop the others.
+        VARCHAR fields are cut to their column widths first (in item_data
+        too). The caller commits.
 
         Args:
             connection: Database connection
             feed_id: Feed ID
-            item_data: Parsed item data
+            items: Parsed item data for items not yet stored
 
         Returns:
-            int: Inserted row ID if new, or None if already exists
+            Dict mapping GUID to row ID for the saved items
+        """
+        if not items:
+            return {}
+
+        fetched_at = datetime.now()
+        rows = {}
+        for item_data in items:
+            for field, max_len in _ITEM_FIELD_LIMITS.items():
+                if item_data.get(field):
+                    item_data[field] = item_data[field][:max_len]
+
+            rows.setdefault(item_data['guid'], (
+                feed_id,
+                item_data['guid'],
+                item_data.get('link'),
+                item_data.get('title'),
+                item_data.get('author'),
+                item_data.get('summary'),
+                item_data.get('content'),
+                item_data.get('image_url'),
+                item_data.get('published_at'),
+                fetched_at
+            ))
+
+        insert_sql = """
+            INSERT IGNORE INTO rss_items (
+                feed_id, guid, link, title, author, summary,
+                content, image_url, published_at, fetched_at
+            ) VALUES (
+                %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
+            )
         """
+
         with connection.cursor() as cursor:
             try:
-                cursor.execute(
-                    """
-                    INSERT INTO rss_items (
-                        feed_id, guid, link, title, author, summary,
-                        content, image_url, published_at, fetched_at
-                    ) VALUES (
-                        %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
-                    )
-                    """,
-                    (
-                        feed_id,
-                        item_data['guid'],
-                        item_data.get('link'),
-                        item_data.get('title'),
-                        item_data.get('author'),
-                        item_data.get('summary'),
-                        item_data.get('content'),
-                        item_data.get('image_url'),
-                        item_data.get('published_at'),
-                        datetime.now()
-                    )
-                )
-                connection.commit()
-                return cursor.lastrowid
-            except pymysql.err.IntegrityError as e:
-                # Item already exists (duplicate guid)
-                logger.debug(f"Item already exists: {item_data['guid']}")
-                return None
+                cursor.executemany(insert_sql, list(rows.values()))
+            except pymysql.MySQLError as e:
+                # A failed multi-row INSERT writes none of its rows; retry
+                # each row so only the bad ones are lost
+                logger.warning(f"Batch insert of {len(rows)} items failed ({e}), retrying one by one")
+                for guid, row in rows.items():
+                    try:
+                        cursor.execute(insert_sql, row)
+                    except pymysql.MySQLError as row_err:
+                        logger.error(f"Error saving item {guid}: {row_err}")
+
+            # executemany only reports the last insert id, so look the ids up
+            placeholders = ', '.join(['%s'] * len(rows))
+            cursor.execute(
+                f"SELECT id, guid FROM rss_items WHERE feed_id = %s AND guid IN ({placeholders})",
+                (feed_id, *rows)
+            )
+            return {row['guid']: row['id'] for row in cursor.fetchall()}
+
+    def download_feed(self, etag: Optional[str] = None, modified: Optional[str] = None) -> Any:
+        """
+        Download and parse the RSS feed, without touching the database
+
+        Sending the validators from the last fetch lets the server answer
+        304 Not Modified with no body.
+
+        Args:
+            etag: ETag from the previous fetch
+            modified: Last-Modified value from the previous fetch
+
+        Returns:
+            Parsed feed from feedparser
+        """
+        return feedparser.parse(self.get_feed_url(), etag=etag, modified=modified)
+
+    @staticmethod
+    def fetch_and_save_all(services: List['BaseRSSService']) -> List[Dict[str, Any]]:
+        """
+        Fetch several feeds, downloading them concurrently
+
+        Only the downloads run in parallel; items are saved one feed at a
+        time on the shared database connection.
+
+        Args:
+            services: RSS services to fetch
 
-    def fetch_and_save(self) -> Dict[str, Any]:
+        Returns:
+            List of fetch_and_save() results, in the order of services
+        """
+        with ThreadPoolExecutor(max_workers=max(len(services), 1)) as pool:
+            downloads = []
+            for service in services:
+                try:
+                    connection = service.get_db_connection()
+                    feed_id = service.get_or_create_feed(connection)
+                    etag, modified = service.get_feed_validators(connection, feed_id)
+                    downloads.append(pool.submit(service.download_feed, etag, modified))
+                except Exception as e:
+                    # fetch_and_save will hit and report the same problem
+                    logger.warning(f"Could not start download for {service.get_feed_url()}: {e}")
+                    downloads.append(None)
+
+            results = []
+            for i, service in enumerate(services):
+                results.append(service.fetch_and_save(downloads[i]))
+                # Drop the saved feed's parsed entries before the next feed
+                downloads[i] = None
+            return results
+
+    def fetch_and_save(self, download: Optional[Future] = None) -> Dict[str, Any]:
         """
         Fetch RSS feed and save items to database
 
+        Args:
+            download: Pending download_feed() result started by
+                      fetch_and_save_all(); the feed is downloaded here if None
+
         Returns:
             Dict with status and statistics
         """
         feed_url = self.get_feed_url()
         logger.info(f"Fetching RSS feed: {feed_url}")
 
-        # Parse RSS feed
-        feed = feedparser.parse(feed_url)
-
-        # --- DEBUG: feed-level diagnostics ---
-        logger.info(f"[DEBUG] Feed status: {getattr(feed, 'status', 'N/A')}, "
-                    f"encoding: {getattr(feed, 'encoding', 'N/A')}, "
-                    f"version: {getattr(feed, 'version', 'N/A')}, "
-                    f"bozo: {feed.bozo}, "
-                    f"entries_count: {len(feed.entries)}")
-        if feed.feed:
-            logger.info(f"[DEBUG] Feed title: {feed.feed.get('title', 'N/A')}, "
-                        f"link: {feed.feed.get('link', 'N/A')}")
-        if feed.bozo:
-            logger.warning(f"Feed parsing warning: {feed.bozo_exception}")
-            logger.warning(f"[DEBUG] Bozo exception type: {type(feed.bozo_exception).__name__}")
-
         connection = None
         new_items = 0
         existing_items = 0
         alerts_sent = 0
 
         # Initialize keyword alert service for checking new articles
-        from .keyword_alert_service import KeywordAlertService
         alert_service = KeywordAlertService(db_config=self.db_config)
 
         try:
@@ -223,14 +453,55 @@ class BaseRSSService(ABC):
             # Get or create feed record
             feed_id = self.get_or_create_feed(connection)
 
-            # Update feed metadata
-            self.update_feed_metadata(connection, feed_id, feed)
+            # Parse RSS feed
+            if download is not None:
+                feed = download.result()
+            else:
+                etag, modified = self.get_feed_validators(connection, feed_id)
+                feed = self.download_feed(etag, modified)
+
+            # --- DEBUG: feed-level diagnostics ---
+            logger.info(f"[DEBUG] Feed status: {getattr(feed, 'status', 'N/A')}, "
+                        f"encoding: {getattr(feed, 'encoding', 'N/A')}, "
+                        f"version: {getattr(feed, 'version', 'N/A')}, "
+                        f"bozo: {feed.bozo}, "
+                        f"entries_count: {len(feed.entries)}")
+            if feed.feed:
+                logger.info(f"[DEBUG] Feed title: {feed.feed.get('title', 'N/A')}, "
+                            f"link: {feed.feed.get('link', 'N/A')}")
+            if feed.bozo:
+                logger.warning(f"Feed parsing warning: {feed.bozo_exception}")
+                logger.warning(f"[DEBUG] Bozo exception type: {type(feed.bozo_exception).__name__}")
+
+            if feed.get('status') == 304:
+                self.update_feed_metadata(connection, feed_id, feed)
+                connection.commit()
+                logger.info(f"Feed not modified since last fetch: {feed_url}")
+                return {
+                    'status': 'success',
+                    'feed_id': feed_id,
+                    'feed_url': feed_url,
+                    'not_modified': True,
+                    'total_items': 0,
+                    'new_items': 0,
+                    'existing_items': 0
+                }
 
             # Get feed title for alert messages
             feed_title = getattr(self, 'feed_title', None) or feed_url
 
-            # Process each item
+            # Skip entries that are already stored before doing any parsing
+            existing = self.get_existing_guids(
+                connection, feed_id, [self.get_entry_guid(entry) for entry in feed.entries]
+            )
+
+            # Parse the new entries first so they can be saved in one batch
+            items = []
+            failed_items = 0
             for idx, entry in enumerate(feed.entries):
+                if self.get_entry_guid(entry) in existing:
+                    existing_items += 1
+                    continue
                 try:
                     logger.info(f"[DEBUG] Processing entry {idx}: "
                                 f"title={entry.get('title', 'N/A')[:80]}, "
@@ -240,54 +511,80 @@ class BaseRSSService(ABC):
                     logger.info(f"[DEBUG] Parsed item: guid={item_data.get('guid', 'N/A')}, "
                                 f"title={str(item_data.get('title', 'N/A'))[:80]}, "
                                 f"published_at={item_data.get('published_at')}")
-                    article_id = self.save_item(connection, feed_id, item_data)
-                    if article_id:
-                        new_items += 1
-                        logger.info(f"[DEBUG] NEW item saved: {item_data.get('guid')} (id={article_id})")
-
-                        # Check new article against keyword alerts (with scoring)
-                        try:
-                            # Quick market cap lookup for scoring
-                            market_caps = []
-                            try:
-                                article_text = (item_data.get('title', '') or '') + '. ' + (item_data.get('summary', '') or '')
-                                with connection.cursor() as mc_cursor:
-                                    mc_cursor.execute(
-                                        "SELECT market_cap_usd FROM companies "
-                                        "WHERE is_active = TRUE AND market_cap_usd IS NOT NULL"
-                                    )
-                                    all_caps = {r['market_cap_usd'] for r in mc_cursor.fetchall() if r['market_cap_usd']}
-                                    # Use company_extractor-style scan to find matching companies
-                                    mc_cursor.execute(
-                                        "SELECT name, market_cap_usd FROM companies "
-                                        "WHERE is_active = TRUE AND market_cap_usd IS NOT NULL"
-                                    )
-                                    import re as _re
-                                    for row in mc_cursor.fetchall():
-                                        pattern = r'\b' + _re.escape(row['name'].lower()) + r'\b'
-                                        if _re.search(pattern, article_text.lower()):
-                                            market_caps.append(row['market_cap_usd'])
-                            except Exception:
-                                pass  # market_caps stays empty — scoring uses default multiplier
-
-                            matched = alert_service.check_and_alert(
-                                article_id=article_id,
-                                title=item_data.get('title', ''),
-                                summary=item_data.get('summary', ''),
-                                link=item_data.get('link', ''),
-                                source=feed_title,
-                                market_caps=market_caps
-                            )
-                            if matched:
-                                alerts_sent += len(matched)
-                        except Exception as alert_err:
-                            logger.warning(f"Keyword alert check failed for article {article_id}: {alert_err}")
-                    else:
-                        existing_items += 1
+                    items.append(item_data)
                 except Exception as e:
                     logger.error(f"Error processing item {idx}: {e}", exc_info=True)
+                    failed_items += 1
                     continue
 
+            new_ids = self.save_items_bulk(connection, feed_id, items)
+            failed_items += len({item_data['guid'] for item_data in items} - new_ids.keys())
+
+            # Keep the old validators if anything was lost, so the next
+            # fetch is not answered with a 304 and the entries are retried
+            if failed_items:
+                logger.warning(f"{failed_items} entries of {feed_url} were not saved; "
+                               f"not storing the new ETag/Last-Modified")
+            self.update_feed_metadata(connection, feed_id, feed,
+                                      save_validators=not failed_items)
+
+            # One commit for the feed record, metadata and items. It must come
+            # before the alert checks, which reference the new rows from
+            # their own connection.
+            connection.commit()
+
+            # Active companies with a market cap, for alert scoring below
+            company_caps = []
+            if new_ids:
+                try:
+                    with connection.cursor() as mc_cursor:
+                        mc_cursor.execute(
+                            "SELECT name, market_cap_usd FROM companies "
+                            "WHERE is_active = TRUE AND market_cap_usd IS NOT NULL"
+                        )
+                        company_caps = [
+                            (row['name'].lower(), row['market_cap_usd'])
+                            for row in mc_cursor.fetchall()
+                        ]
+                except Exception as e:
+                    # company_caps stays empty — scoring uses default multiplier
+                    logger.warning(f"Could not load company market caps for scoring: {e}")
+
+            for item_data in items:
+                # pop() so an entry repeated within the feed is only alerted once
+                article_id = new_ids.pop(item_data['guid'], None)
+                if not article_id:
+                    existing_items += 1
+                    continue
+
+                new_items += 1
+                logger.info(f"[DEBUG] NEW item saved: {item_data.get('guid')} (id={article_id})")
+
+                # Check new article against keyword alerts (with scoring)
+                try:
+                    # Quick market cap lookup for scoring
+                    article_text = (item_data.get('title', '') or '') + '. ' + (item_data.get('summary', '') or '')
+                    article_lower = article_text.lower()
+                    # Use company_extractor-style scan to find matching companies;
+                    # the substring test rules out most names before any regex runs
+                    market_caps = [
+                        market_cap for name, market_cap in company_caps
+                        if name in article_lower and _word_pattern(name).search(article_lower)
+                    ]
+
+                    matched = alert_service.check_and_alert(
+                        article_id=article_id,
+                        title=item_data.get('title', ''),
+                        summary=item_data.get('summary', ''),
+                        link=item_data.get('link', ''),
+                        source=feed_title,
+                        market_caps=market_caps
+                    )
+                    if matched:
+                        alerts_sent += len(matched)
+                except Exception as alert_err:
+                    logger.warning(f"Keyword alert check failed for article {article_id}: {alert_err}")
+
             result = {
                 'status': 'success',
                 'feed_id': feed_id,
@@ -308,8 +605,15 @@ class BaseRSSService(ABC):
                 'error': str(e)
             }
         finally:
+            # The connection stays open for the next invocation. Roll back
+            # anything uncommitted after an error and end the read snapshot
+            # left by the alert lookups.
             if connection:
-                connection.close()
+                try:
+                    connection.rollback()
+                except pymysql.MySQLError as e:
+                    logger.warning(f"Could not reset DB connection, discarding it: {e}")
+                    self.discard_db_connection()
 
     @staticmethod
     def parse_datetime(date_string: Optional[str]) -> Optional[datetime]:
@@ -325,10 +629,30 @@ class BaseRSSService(ABC):
         if not date_string:
             return None
 
+        # RFC 822 (RSS pubDate), the common case. parsedate_to_datetime reads
+        # other layouts loosely (silently dropping "PM", say), so it is only
+        # used on strings of the RFC 822 shape.
+        if _RFC822_RE.match(date_string):
+            try:
+                return parsedate_to_datetime(date_string)
+            except (TypeError, ValueError):
+                pass
+
+        for date_format in _DATE_FORMATS:
+            try:
+                return datetime.strptime(date_string, date_format)
+            except ValueError:
+                pass
+
+        # ISO 8601 (Atom)
+        try:
+            return datetime.fromisoformat(date_string)
+        except ValueError:
+            pass
+
         try:
-            # Try parsing common formats
-            from dateutil import parser
-            return parser.parse(date_string)
+            # Fall back to the generic parser for anything else
+            return dateutil_parser.parse(date_string)
         except Exception as e:
             logger.warning(f"Could not parse date: {date_string} - {e}")
             return None
@@ -348,23 +672,11 @@ class BaseRSSService(ABC):
             return None
 
         try:
-            from html.parser import HTMLParser
-
-            class MLStripper(HTMLParser):
-                def __init__(self):
-                    super().__init__()
-                    self.reset()
-                    self.strict = False
-                    self.convert_charrefs = True
-                    self.text = []
-
-                def handle_data(self, d):
-                    self.text.append(d)
-
-                def get_data(self):
-                    return ''.join(self.text)
+            # lxml tokenizes and collects text in C; fall back to HTMLParser
+            if lxml_html is not None:
+                return lxml_html.fromstring(html_content).text_content()
 
-            s = MLStripper()
+            s = _MLStripper()
             s.feed(html_content)
             return s.get_data()
         except Exception as e:
@@ -55,39 +55,36 @@ class BloombergService(BaseRSSService):
         Returns:
             Dict containing parsed item data
         """
+        # FeedParserDict lookups go through its key-alias handling; read the
+        # fields from a plain dict copy instead (feedparser stores dc:creator
+        # as 'author' and description as 'summary')
+        d = dict(item)
+
         # Extract basic fields
-        guid = item.get('id') or item.get('link', '')
-        link = item.get('link', '')
-        title = item.get('title', '')
+        guid = self.get_entry_guid(d)
+        link = d.get('link', '')
+        title = d.get('title', '')
 
         # Extract author from dc:creator
-        author = None
-        if 'author' in item:
-            author = item.get('author')
-        elif 'dc_creator' in item:
-            author = item.get('dc_creator')
+        author = d['author'] if 'author' in d else d.get('dc_creator')
 
         # Extract summary/description
-        summary = item.get('summary', '') or item.get('description', '')
+        summary = d.get('summary', '') or d.get('description', '')
 
         # Extract content (might be in content field)
-        content = None
-        if 'content' in item and item['content']:
-            content = item['content'][0].get('value', '')
+        content = d.get('content')
+        content = content[0].get('value', '') if content else None
 
         # Extract image URL from media:content
-        image_url = None
-        if 'media_content' in item and item['media_content']:
-            image_url = item['media_content'][0].get('url')
-        elif 'media_thumbnail' in item and item['media_thumbnail']:
-            image_url = item['media_thumbnail'][0].get('url')
+        media = d.get('media_content') or d.get('media_thumbnail')
+        image_url = media[0].get('url') if media else None
 
         # Parse publication date
         published_at = None
-        if 'published' in item:
-            published_at = self.parse_datetime(item.get('published'))
-        elif 'pubDate' in item:
-            published_at = self.parse_datetime(item.get('pubDate'))
+        if 'published' in d:
+            published_at = self.parse_datetime(d['published'])
+        elif 'pubDate' in d:
+            published_at = self.parse_datetime(d['pubDate'])
 
         return {
             'guid': guid,
@@ -21,13 +21,86 @@ Usage:
 import os
 import re
 import logging
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import accumulate
 import spacy
 import pymysql
 from typing import List, Dict, Optional, Set, Tuple
 from .stock_ticker_data import COMPANY_TICKER_MAP, ALIAS_TO_COMPANY
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 logger = logging.getLogger(__name__)
 
+# Corporate suffixes removed by _normalize_company_name, tried in this order.
+# Each alternative is its own group so match.lastindex tells which one matched.
+_SUFFIX_PATTERNS = (
+    r'inc\.?', r'incorporated', r'corp\.?', r'corporation', r'ltd\.?', r'limited',
+    r'plc', r'llc', r'co\.?', r'company', r'ag', r'se', r's\.a\.', r'n\.v\.',
+)
+_SUFFIX_RE = re.compile(
+    r'\s+(?:' + '|'.join(f'({p})' for p in _SUFFIX_PATTERNS) + r')$',
+    re.IGNORECASE
+)
+_POSSESSIVE_RE = re.compile(r"'s$")
+
+# Texts with no capital letter cannot name an ORG spaCy would find; NER is
+# skipped for them
+_ORG_HINT_RE = re.compile(r'[A-Z]')
+
+# Only the entity recognizer is used; these pipeline components are not loaded
+_DISABLED_PIPES = ["parser", "tagger", "lemmatizer", "attribute_ruler"]
+
+# Loaded spaCy pipelines by model name, shared by all extractors and reused
+# across warm Lambda invocations
+_NLP_CACHE = {}
+
+# Shared extractor for extract_from_article(), created on first use
+_EXTRACTOR = None
+
+# Max find_ticker_info() results kept per extractor before the cache is reset
+_TICKER_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=8192)
+def _normalize_company_name(name: str) -> str:
+    """Normalize a company name; see CompanyExtractor._normalize_company_name."""
+    # Convert to lowercase
+    normalized = name.lower().strip()
+
+    # Remove common suffixes that might prevent matching. Only one suffix
+    # can sit at the end at a time; a newly exposed one is only removed if
+    # it comes later in _SUFFIX_PATTERNS ("foo corp inc" -> "foo").
+    last_index = 0
+    match = _SUFFIX_RE.search(normalized)
+    while match and match.lastindex > last_index:
+        last_index = match.lastindex
+        normalized = normalized[:match.start()]
+        match = _SUFFIX_RE.search(normalized)
+
+    # Remove possessives
+    normalized = _POSSESSIVE_RE.sub('', normalized)
+
+    # Clean up extra whitespace
+    normalized = ' '.join(normalized.split())
+
+    return normalized
+
+
+def _is_word_char(text: str, i: int) -> bool:
+    """Whether text[i] is a regex word character; False outside the string."""
+    return 0 <= i < len(text) and (text[i].isalnum() or text[i] == '_')
+
+
+def _is_word_bounded(text: str, start: int, end: int) -> bool:
+    """Whether text[start:end] has a word boundary at both ends, as regex \\b checks."""
+    return (_is_word_char(text, start - 1) != _is_word_char(text, start)
+            and _is_word_char(text, end - 1) != _is_word_char(text, end))
+
 
 class CompanyExtractor:
     """Extract company names and map them to stock tickers using NER."""
@@ -44,13 +117,15 @@ class CompanyExtractor:
                     Falls back to hardcoded data if DB is unavailable.
             db_config: Database configuration dict. If None, uses env vars.
         """
-        try:
-            self.nlp = spacy.load(model_name)
-        except OSError:
-            raise RuntimeError(
-                f"spaCy model '{model_name}' not found. "
-                f"Install it with: python -m spacy download {model_name}"
-            )
+        if model_name not in _NLP_CACHE:
+            try:
+                _NLP_CACHE[model_name] = spacy.load(model_name, disable=_DISABLED_PIPES)
+            except OSError:
+                raise RuntimeError(
+                    f"spaCy model '{model_name}' not found. "
+                    f"Install it with: python -m spacy download {model_name}"
+                )
+        self.nlp = _NLP_CACHE[model_name]
 
         self._db_config = db_config
 
@@ -132,6 +207,9 @@ class CompanyExtractor:
             for row in aliases:
                 self.alias_map[row['alias'].lower()] = row['company_name'].lower()
 
+            self._build_partial_index()
+            self._build_scan_pattern()
+
         finally:
             connection.close()
 
@@ -149,6 +227,91 @@ class CompanyExtractor:
             for alias, company in ALIAS_TO_COMPANY.items()
         }
 
+        self._build_partial_index()
+        self._build_scan_pattern()
+
+    def _build_partial_index(self):
+        """Index normalized_map keys for the partial-match step of find_ticker_info."""
+        self._keys = list(self.normalized_map)
+        self._key_order = {key: i for i, key in enumerate(self._keys)}
+        self._max_key_len = max(map(len, self._keys), default=0)
+
+        # All keys in one newline-separated string, so finding the keys that
+        # contain a name is a single str.find; _key_starts maps a match
+        # position back to its key.
+        self._keys_blob = '\n'.join(self._keys)
+        self._key_starts = list(accumulate((len(key) + 1 for key in self._keys[:-1]), initial=0))
+
+        # find_ticker_info() results depend on the maps above
+        self._ticker_cache = {}
+
+    def _build_scan_pattern(self):
+        """Compile the alias_map scan used by _scan_text_for_known_companies."""
+        # An empty name would "match" every text
+        names = sorted(filter(None, self.alias_map), key=len, reverse=True)
+
+        # With pyahocorasick installed, one automaton finds every occurrence
+        # of every name in a single pass; word boundaries are checked per hit
+        self._scan_automaton = None
+        if ahocorasick is not None and names:
+            self._scan_automaton = ahocorasick.Automaton()
+            for name in names:
+                self._scan_automaton.add_word(name, name)
+            self._scan_automaton.make_automaton()
+            return
+
+        # One pass over the text: at each position the lookahead reports the
+        # longest name that matches there, without consuming the text, so
+        # overlapping names further on are still found.
+        self._scan_re = re.compile(
+            r'(?=\b(' + '|'.join(map(re.escape, names)) + r')\b)'
+        ) if names else None
+
+        # Shorter names that also match wherever a longer one does, e.g.
+        # "novo" inside "novo nordisk"; the word boundary after the shorter
+        # name falls inside the longer one, so it only depends on the name.
+        self._scan_prefixes = {}
+        for name in names:
+            prefixes = [
+                name[:i] for i in range(1, len(name))
+                if name[:i] in self.alias_map and re.match(re.escape(name[:i]) + r'\b', name)
+            ]
+            if prefixes:
+                self._scan_prefixes[name] = prefixes
+
+    def _find_partial_key(self, normalized: str) -> Optional[str]:
+        """
+        Find the first key in normalized_map that contains, or is contained in, a name.
+
+        Gives the same result as scanning normalized_map in order for
+        `normalized in key or key in normalized`, without looping over every key.
+
+        Args:
+            normalized: Normalized company name
+
+        Returns:
+            Matching normalized_map key, or None
+        """
+        best = None
+
+        # Keys contained in the name: look up each substring up to the longest key length
+        length = len(normalized)
+        for start in range(length):
+            for end in range(start + 1, min(length, start + self._max_key_len) + 1):
+                order = self._key_order.get(normalized[start:end])
+                if order is not None and (best is None or order < best):
+                    best = order
+
+        # Keys containing the name: the first hit in the blob is in the earliest such key.
+        # normalized has no newlines, so a hit never spans two keys.
+        pos = self._keys_blob.find(normalized)
+        if pos != -1:
+            order = bisect_right(self._key_starts, pos) - 1
+            if best is None or order < best:
+                best = order
+
+        return self._keys[best] if best is not None else None
+
     def extract_organizations(self, text: str) -> List[str]:
         """
         Extract organization names from text using spaCy NER.
@@ -159,11 +322,21 @@ class CompanyExtractor:
         Returns:
             List of organization names detected by NER
         """
-        if not text:
+        if not text or not _ORG_HINT_RE.search(text):
             return []
 
-        doc = self.nlp(text)
+        return self._organizations_from_doc(self.nlp(text))
 
+    def _organizations_from_doc(self, doc) -> List[str]:
+        """
+        Collect ORG entity names from a processed spaCy doc.
+
+        Args:
+            doc: spaCy Doc produced by self.nlp
+
+        Returns:
+            List of organization names detected by NER
+        """
         # Extract all ORG entities
         organizations = []
         all_ents = [(ent.text, ent.label_) for ent in doc.ents]
@@ -188,27 +361,7 @@ class CompanyExtractor:
         Returns:
             Normalized company name
         """
-        # Convert to lowercase
-        normalized = name.lower().strip()
-
-        # Remove common suffixes that might prevent matching
-        suffixes = [
-            r'\s+inc\.?$', r'\s+incorporated$', r'\s+corp\.?$',
-            r'\s+corporation$', r'\s+ltd\.?$', r'\s+limited$',
-            r'\s+plc$', r'\s+llc$', r'\s+co\.?$', r'\s+company$',
-            r'\s+ag$', r'\s+se$', r'\s+s\.a\.$', r'\s+n\.v\.$'
-        ]
-
-        for suffix in suffixes:
-            normalized = re.sub(suffix, '', normalized, flags=re.IGNORECASE)
-
-        # Remove possessives
-        normalized = re.sub(r"'s$", '', normalized)
-
-        # Clean up extra whitespace
-        normalized = ' '.join(normalized.split())
-
-        return normalized
+        return _normalize_company_name(name)
 
     def find_ticker_info(self, company_name: str) -> Optional[Dict]:
         """
@@ -220,6 +373,18 @@ class CompanyExtractor:
         Returns:
             Dict with ticker info if found, None otherwise
         """
+        if company_name in self._ticker_cache:
+            info = self._ticker_cache[company_name]
+            return dict(info) if info else None
+
+        info = self._lookup_ticker_info(company_name)
+        if len(self._ticker_cache) >= _TICKER_CACHE_SIZE:
+            self._ticker_cache.clear()
+        self._ticker_cache[company_name] = info
+        return dict(info) if info else None
+
+    def _lookup_ticker_info(self, company_name: str) -> Optional[Dict]:
+        """Uncached lookup behind find_ticker_info()."""
         normalized = self._normalize_company_name(company_name)
         logger.info(f"[DEBUG] find_ticker_info: input='{company_name}', normalized='{normalized}'")
 
@@ -254,21 +419,21 @@ class CompanyExtractor:
 
         # Try partial matching (fuzzy match)
         logger.info(f"[DEBUG] find_ticker_info: no alias match, trying partial for '{normalized}'")
-        for key, (original_key, data) in self.normalized_map.items():
-            # Check if the normalized company name contains or is contained by a known company
-            if normalized in key or key in normalized:
-                logger.info(f"[DEBUG] find_ticker_info: partial match '{normalized}' <-> '{key}' -> {data['ticker']}")
-                # Prefer longer matches (more specific)
-                return {
-                    'company': company_name,
-                    'matched_key': original_key,
-                    'matched_via': 'partial',
-                    'ticker': data['ticker'],
-                    'exchange': data['exchange'],
-                    'full_name': data['full_name'],
-                    'market_cap_usd': data.get('market_cap_usd'),
-                    'confidence': 'medium'
-                }
+        # Check if the normalized company name contains or is contained by a known company
+        key = self._find_partial_key(normalized)
+        if key is not None:
+            original_key, data = self.normalized_map[key]
+            logger.info(f"[DEBUG] find_ticker_info: partial match '{normalized}' <-> '{key}' -> {data['ticker']}")
+            return {
+                'company': company_name,
+                'matched_key': original_key,
+                'matched_via': 'partial',
+                'ticker': data['ticker'],
+                'exchange': data['exchange'],
+                'full_name': data['full_name'],
+                'market_cap_usd': data.get('market_cap_usd'),
+                'confidence': 'medium'
+            }
 
         logger.info(f"[DEBUG] find_ticker_info: NO match for '{company_name}'")
         return None
@@ -284,19 +449,28 @@ class CompanyExtractor:
         Returns:
             List of matched company/alias names found in the text
         """
-        found = []
-        text_lower = text.lower()
-
-        # Check all known company names and aliases against the text
-        for name in self.alias_map:
-            # Use word boundary matching to avoid partial word matches
-            pattern = r'\b' + re.escape(name) + r'\b'
-            match = re.search(pattern, text_lower)
-            if match:
-                # Use the original casing from the text
-                start, end = match.start(), match.end()
-                original_case = text[start:end]
-                found.append(original_case)
+        # First position of each known name in the text
+        starts = {}
+        if self._scan_automaton is not None:
+            text_lower = text.lower()
+            for end, name in self._scan_automaton.iter(text_lower):
+                start = end - len(name) + 1
+                if name not in starts and _is_word_bounded(text_lower, start, end + 1):
+                    starts[name] = start
+        elif self._scan_re is not None:
+            text_lower = text.lower()
+            for match in self._scan_re.finditer(text_lower):
+                start = match.start()
+                name = match.group(1)
+                starts.setdefault(name, start)
+                for prefix in self._scan_prefixes.get(name, ()):
+                    starts.setdefault(prefix, start)
+
+        # Report matches in alias_map order, using the original casing from the text
+        found = [
+            text[starts[name]:starts[name] + len(name)]
+            for name in self.alias_map if name in starts
+        ]
 
         logger.info(f"[DEBUG] _scan_text_for_known_companies: found {found}")
         return found
@@ -316,8 +490,45 @@ class CompanyExtractor:
                 - unmatched: List of companies without ticker matches
         """
         # Extract organizations using NER
-        organizations = self.extract_organizations(text)
+        return self._match_organizations(text, self.extract_organizations(text))
 
+    def extract_many(self, texts: List[str], batch_size: int = 32) -> List[Dict]:
+        """
+        Extract companies and tickers from several texts, running NER in batches.
+
+        Args:
+            texts: Input texts to process
+            batch_size: Number of texts spaCy processes per batch
+
+        Returns:
+            List with one extract_companies_and_tickers() result per text;
+            identical texts share the same result dict
+        """
+        # Syndicated stories often repeat the same title and summary, so each
+        # distinct text is only processed once
+        unique_texts = list(dict.fromkeys(texts))
+
+        run_ner = [bool(text) and _ORG_HINT_RE.search(text) is not None for text in unique_texts]
+        docs = self.nlp.pipe(
+            (text for text, ner in zip(unique_texts, run_ner) if ner), batch_size=batch_size
+        )
+        results = {
+            text: self._match_organizations(text, self._organizations_from_doc(next(docs)) if ner else [])
+            for text, ner in zip(unique_texts, run_ner)
+        }
+        return [results[text] for text in texts]
+
+    def _match_organizations(self, text: str, organizations: List[str]) -> Dict:
+        """
+        Map NER organizations, plus known names found in the text, to tickers.
+
+        Args:
+            text: Input text the organizations were extracted from
+            organizations: Organization names detected by NER
+
+        Returns:
+            Dict in the format returned by extract_companies_and_tickers()
+        """
         # Fallback: scan text for known company names that NER may have missed
         fallback_companies = self._scan_text_for_known_companies(text)
         organizations.extend(fallback_companies)
@@ -371,6 +582,14 @@ class CompanyExtractor:
         return stock_tickers, company_names
 
 
+def _get_extractor() -> CompanyExtractor:
+    """Return the shared CompanyExtractor, creating it on first use."""
+    global _EXTRACTOR
+    if _EXTRACTOR is None:
+        _EXTRACTOR = CompanyExtractor()
+    return _EXTRACTOR
+
+
 def extract_from_article(title: str, summary: str = None) -> Dict:
     """
     Convenience function to extract companies and tickers from an article.
@@ -382,7 +601,7 @@ def extract_from_article(title: str, summary: str = None) -> Dict:
     Returns:
         Extraction result dict from extract_companies_and_tickers()
     """
-    extractor = CompanyExtractor()
+    extractor = _get_extractor()
 
     # Combine title and summary for better context
     text = title
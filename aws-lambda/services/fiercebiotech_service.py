@@ -4,11 +4,18 @@ Fierce Biotech RSS Feed Service
 
 import logging
 import re
+from datetime import datetime
 from typing import Dict, Any, Optional
 from .base_rss_service import BaseRSSService
 
 logger = logging.getLogger(__name__)
 
+# Trailing "am"/"pm" in dates like "Feb 5, 2026 4:54am"
+_AMPM_RE = re.compile(r'\s*([ap])m\s*$', re.IGNORECASE)
+
+# Text of an <a> tag, as in the title and author fields
+_ANCHOR_TEXT_RE = re.compile(r'<a\b[^>]*>([^<]+)</a>', re.IGNORECASE)
+
 
 class FiercebiotechService(BaseRSSService):
     """
@@ -53,9 +60,9 @@ class FiercebiotechService(BaseRSSService):
             return None
 
         # Extract text from <a> tag
-        match = re.search(r'>([^<]+)</a>', html_link)
+        match = _ANCHOR_TEXT_RE.search(html_link)
         if match:
-            return match.group(1)
+            return match.group(1).strip()
 
         # If no match, clean HTML tags
         return self.clean_html(html_link)
@@ -76,19 +83,13 @@ class FiercebiotechService(BaseRSSService):
             return None
 
         try:
-            from datetime import datetime
             # Try parsing "Feb 5, 2026 4:54am" format
-            # Clean the string first
-            cleaned = date_string.strip()
-
-            # Handle AM/PM
-            if 'am' in cleaned.lower() or 'pm' in cleaned.lower():
-                # Convert to 12-hour format with AM/PM
-                if 'am' in cleaned.lower():
-                    cleaned = cleaned.replace('am', ' AM').replace('AM', ' AM')
-                else:
-                    cleaned = cleaned.replace('pm', ' PM').replace('PM', ' PM')
+            # Normalize the trailing am/pm to " AM"/" PM"
+            cleaned, has_ampm = _AMPM_RE.subn(
+                lambda m: ' ' + m.group(1).upper() + 'M', date_string.strip()
+            )
 
+            if has_ampm:
                 # Try parsing with time
                 try:
                     return datetime.strptime(cleaned, '%b %d, %Y %I:%M %p')
@@ -119,20 +120,21 @@ class FiercebiotechService(BaseRSSService):
         Returns:
             Dict containing parsed item data
         """
+        # FeedParserDict lookups go through its key-alias handling; read the
+        # fields from a plain dict copy instead (feedparser stores dc:creator
+        # as 'author' and description as 'summary')
+        d = dict(item)
+
         # Extract basic fields
-        guid = item.get('id') or item.get('link', '')
-        link = item.get('link', '')
+        guid = self.get_entry_guid(d)
+        link = d.get('link', '')
 
         # Extract title (contains HTML)
-        title_html = item.get('title', '')
+        title_html = d.get('title', '')
         title = self.extract_text_from_html_link(title_html)
 
         # Extract author from dc:creator (contains HTML)
-        author_html = None
-        if 'author' in item:
-            author_html = item.get('author')
-        elif 'dc_creator' in item:
-            author_html = item.get('dc_creator')
+        author_html = d['author'] if 'author' in d else d.get('dc_creator')
 
         author = self.extract_text_from_html_link(author_html)
 
@@ -142,23 +144,22 @@ class FiercebiotechService(BaseRSSService):
             author = author.strip()
 
         # Extract summary/description
-        summary = item.get('summary', '') or item.get('description', '')
+        summary = d.get('summary', '') or d.get('description', '')
         summary = self.clean_html(summary)
 
         # Extract content
-        content = None
-        if 'content' in item and item['content']:
-            content = item['content'][0].get('value', '')
+        content = d.get('content')
+        content = content[0].get('value', '') if content else None
 
         # Fierce Biotech typically doesn't include images in RSS
         image_url = None
 
         # Parse publication date (custom format)
         published_at = None
-        if 'published' in item:
-            published_at = self.parse_fiercebiotech_date(item.get('published'))
-        elif 'pubDate' in item:
-            published_at = self.parse_fiercebiotech_date(item.get('pubDate'))
+        if 'published' in d:
+            published_at = self.parse_fiercebiotech_date(d['published'])
+        elif 'pubDate' in d:
+            published_at = self.parse_fiercebiotech_date(d['pubDate'])
 
         return {
             'guid': guid,
@@ -22,6 +22,7 @@ import re
 import json
 import logging
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, List, Optional, Any
 from urllib.request import urlopen, Request
 from urllib.error import HTTPError
@@ -36,6 +37,12 @@ logger = logging.getLogger(__name__)
 DEFAULT_ALERT_THRESHOLD = 5
 
 
+@lru_cache(maxsize=1024)
+def _keyword_pattern(keyword: str) -> re.Pattern:
+    """Compiled whole-word pattern for a keyword, reused across articles."""
+    return re.compile(r'\b' + re.escape(keyword) + r'\b')
+
+
 class KeywordAlertService:
     """Check articles against keywords, score them, and send Telegram alerts."""
 
@@ -232,8 +239,8 @@ class KeywordAlertService:
         text_lower = text.lower()
         matched = []
         for kw in keywords:
-            pattern = r'\b' + re.escape(kw['keyword']) + r'\b'
-            if re.search(pattern, text_lower):
+            # Cheap substring test first; the regex only confirms word boundaries
+            if kw['keyword'] in text_lower and _keyword_pattern(kw['keyword']).search(text_lower):
                 matched.append(kw)
                 logger.info(f"[DEBUG] MATCH FOUND: '{kw['keyword']}' (score: {kw['event_score']})")
 
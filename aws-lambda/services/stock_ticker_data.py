@@ -336,3 +336,16 @@ for company, data in COMPANY_TICKER_MAP.items():
     # Add all aliases
     for alias in data.get("aliases", []):
         ALIAS_TO_COMPANY[alias.lower()] = company
+
+# Flattened rows for bulk loading into the companies / company_aliases tables
+# (see import_tickers.py --seed), built once at import
+COMPANY_TICKER_ROWS = tuple(
+    {
+        "name": company.lower(),
+        "ticker": data["ticker"],
+        "exchange": data["exchange"],
+        "full_name": data["full_name"],
+        "aliases": tuple(data.get("aliases", ())),
+    }
+    for company, data in COMPANY_TICKER_MAP.items()
+)
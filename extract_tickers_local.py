@@ -44,15 +44,14 @@ def load_env():
     }
 
 
+# Resolved once at import; the .env file does not change during a run
+_DB_CONFIG = load_env()
+
+
 def get_db_connection():
     """Create a database connection."""
-    db_config = load_env()
     return pymysql.connect(
-        host=db_config['host'],
-        user=db_config['user'],
-        password=db_config['password'],
-        database=db_config['database'],
-        port=db_config['port'],
+        **_DB_CONFIG,
         charset='utf8mb4',
         cursorclass=pymysql.cursors.DictCursor
     )
@@ -155,19 +154,24 @@ def process_database_records(limit: int = 10, update: bool = False):
             print(f"\nFound {len(records)} records to process\n")
 
             processed = 0
-            updated = 0
+            updates = []
+            ticker_rows = []
 
+            # Combine title and summary for better context
+            texts = []
             for record in records:
-                processed += 1
-                print(f"\n{processed}. [{record['id']}] {record['title'][:80]}...")
-                print("-" * 80)
-
-                # Combine title and summary for better context
                 text = record['title']
                 if record.get('summary'):
                     text = f"{text}. {record['summary']}"
+                texts.append(text)
 
-                result = extractor.extract_companies_and_tickers(text)
+            # Run NER over all records in batches
+            results = extractor.extract_many(texts)
+
+            for record, result in zip(records, results):
+                processed += 1
+                print(f"\n{processed}. [{record['id']}] {record['title'][:80]}...")
+                print("-" * 80)
 
                 if result['tickers']:
                     stock_tickers, company_names = extractor.format_for_database(result)
@@ -176,25 +180,35 @@ def process_database_records(limit: int = 10, update: bool = False):
                     print(f"   Tickers: {stock_tickers}")
 
                     if update:
-                        # Update the database
-                        update_query = """
-                            UPDATE rss_items
-                            SET stock_tickers = %s, company_names = %s
-                            WHERE id = %s
-                        """
-                        cursor.execute(update_query, (stock_tickers, company_names, record['id']))
-                        updated += 1
-                        print(f"   ✓ Database updated")
+                        # Queue the update; all rows are written in one batch below
+                        updates.append((stock_tickers, company_names, record['id']))
+                        ticker_rows.extend((record['id'], t) for t in result['tickers'])
                 else:
                     print(f"   No tickers found")
 
-            if update:
+            if update and updates:
+                update_query = """
+                    UPDATE rss_items
+                    SET stock_tickers = %s, company_names = %s
+                    WHERE id = %s
+                """
+                cursor.executemany(update_query, updates)
+                # Replace, not merge, so tickers dropped on re-extraction stop matching
+                placeholders = ', '.join(['%s'] * len(updates))
+                cursor.execute(
+                    f"DELETE FROM rss_item_tickers WHERE item_id IN ({placeholders})",
+                    [item_id for _, _, item_id in updates]
+                )
+                cursor.executemany(
+                    "INSERT IGNORE INTO rss_item_tickers (item_id, ticker) VALUES (%s, %s)",
+                    ticker_rows
+                )
                 connection.commit()
-                print(f"\n✓ Committed {updated} updates to database")
+                print(f"\n✓ Committed {len(updates)} updates to database")
 
             print(f"\nProcessed: {processed} records")
             if update:
-                print(f"Updated: {updated} records")
+                print(f"Updated: {len(updates)} records")
 
     except Exception as e:
         print(f"Error: {e}")
@@ -25,12 +25,109 @@ import csv
 import re
 import argparse
 import io
-from typing import List, Dict, Tuple
-from urllib.request import urlopen, Request
+from functools import lru_cache
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Tuple
 
 import pymysql
+import urllib3
 from dotenv import load_dotenv
 
+# Shared keep-alive pool for downloads
+_HTTP = urllib3.PoolManager(
+    num_pools=4,
+    maxsize=10,
+    headers={'User-Agent': 'Mozilla/5.0'},
+    timeout=30.0,
+    retries=urllib3.Retry(3),
+)
+
+# Rows per executemany() call in bulk_insert
+INSERT_BATCH_SIZE = 1000
+
+# Share class designations, e.g. "Alphabet Inc. Class A"
+_CLASS_RE = re.compile(r'\s+Class\s+[A-Z]\b', re.IGNORECASE)
+
+# NASDAQ listing exchange codes
+_EXCHANGE_MAP = {
+    'Q': 'NASDAQ',
+    'N': 'NYSE',
+    'A': 'AMEX',
+    'P': 'NYSE ARCA',
+    'Z': 'BATS',
+    'V': 'IEXG',
+}
+
+# Characters marking non-common share symbols (e.g. "BRK.A", "ABC$D")
+_BAD_SYMBOL_RE = re.compile(r'[$. ]')
+
+# Corporate suffixes stripped by _clean_company_name (order matters - longer first).
+# Matching is case-sensitive on purpose: cleaned names are the companies.name
+# unique key, so the stripping rules must stay stable across imports.
+_SUFFIXES = (
+    ' Incorporated', ' incorporated',
+    ' Corporation', ' corporation',
+    ' Common Stock', ' common stock',
+    ' Ordinary Shares', ' ordinary shares',
+    ' American Depositary Shares',
+    ' Holdings', ' holdings',
+    ' Group', ' group',
+    ' Inc.', ' inc.', ' Inc', ' inc',
+    ' Corp.', ' corp.', ' Corp', ' corp',
+    ' Ltd.', ' ltd.', ' Ltd', ' ltd',
+    ' Limited', ' limited',
+    ' PLC', ' plc', ' Plc',
+    ' Co.', ' co.', ' Co', ' co',
+    ' Company', ' company',
+    ' S.A.', ' s.a.',
+    ' N.V.', ' n.v.',
+    ' SE', ' AG',
+)
+_SUFFIX_ORDER = {suffix: i for i, suffix in enumerate(_SUFFIXES)}
+_SUFFIX_RE = re.compile('(?:' + '|'.join(map(re.escape, _SUFFIXES)) + r')\Z')
+
+# Substrings (of the lowercased name) marking non-company security types
+_EXCLUDE_PATTERNS = (
+    'warrant',
+    'warrants',
+    ' etf',
+    ' etn',
+    ' fund',
+    ' trust',
+    ' notes ',
+    ' note ',
+    'preferred',
+    ' pfd',
+    ' right',
+    ' rights',
+    ' unit',
+    ' units',
+    'depositary receipt',
+    'acquisition corp',
+    'blank check',
+    ' lp',
+    ' l.p.',
+    'limited partnership',
+    'royalty trust',
+    'closed-end',
+    'closed end',
+    'municipal',
+    'bond',
+    'income fund',
+    'debt',
+    'debenture',
+    'convertible',
+    'fixed rate',
+    'floating rate',
+    'perpetual',
+    'senior notes',
+    'subordinated',
+)
+_EXCLUDE_RE = re.compile('|'.join(map(re.escape, _EXCLUDE_PATTERNS)))
+
+# Trailing punctuation and whitespace removed from cleaned names
+_TRAIL = ' ,.'
+
 
 def load_env():
     """Load environment variables from .env file."""
@@ -44,81 +141,55 @@ def load_env():
     }
 
 
+# Resolved once at import; the .env file does not change during a run
+_DB_CONFIG = load_env()
+
+# Shared by every command in a run; opened lazily, closed by close_db_connection()
+_connection = None
+
+
 def get_db_connection():
-    """Create a database connection."""
-    db_config = load_env()
-    return pymysql.connect(
-        host=db_config['host'],
-        user=db_config['user'],
-        password=db_config['password'],
-        database=db_config['database'],
-        port=db_config['port'],
-        charset='utf8mb4',
-        cursorclass=pymysql.cursors.DictCursor
-    )
+    """Return the shared database connection, reconnecting if it was dropped."""
+    global _connection
+    if _connection is None or not _connection.open:
+        _connection = pymysql.connect(
+            **_DB_CONFIG,
+            charset='utf8mb4',
+            cursorclass=pymysql.cursors.DictCursor
+        )
+    else:
+        _connection.ping(reconnect=True)
+    return _connection
+
+
+def close_db_connection():
+    """Close the shared database connection if one is open."""
+    global _connection
+    if _connection is not None and _connection.open:
+        try:
+            _connection.close()
+        except pymysql.MySQLError:
+            pass  # already broken; dropping the reference is enough
+    _connection = None
 
 
-def _is_common_stock(security_name: str, etf_flag: str) -> bool:
+def _is_common_stock(name_lower: str) -> bool:
     """
-    Check if a security is a common stock (not an ETF, warrant, trust, etc.).
+    Check if a security is a common stock (not a warrant, trust, etc.).
+
+    ETFs are filtered by the caller using the NASDAQ ETF flag.
 
     Args:
-        security_name: Full security name from NASDAQ data
-        etf_flag: 'Y' if ETF, 'N' otherwise
+        name_lower: Full security name from NASDAQ data, already lowercased
 
     Returns:
         True if this looks like a regular company common stock
     """
-    if etf_flag == 'Y':
-        return False
-
-    name_lower = security_name.lower()
-
     # Exclude non-company security types
-    exclude_patterns = [
-        'warrant',
-        'warrants',
-        ' etf',
-        ' etn',
-        ' fund',
-        ' trust',
-        ' notes ',
-        ' note ',
-        'preferred',
-        ' pfd',
-        ' right',
-        ' rights',
-        ' unit',
-        ' units',
-        'depositary receipt',
-        'acquisition corp',
-        'blank check',
-        ' lp',
-        ' l.p.',
-        'limited partnership',
-        'royalty trust',
-        'closed-end',
-        'closed end',
-        'municipal',
-        'bond',
-        'income fund',
-        'debt',
-        'debenture',
-        'convertible',
-        'fixed rate',
-        'floating rate',
-        'perpetual',
-        'senior notes',
-        'subordinated',
-    ]
-
-    for pattern in exclude_patterns:
-        if pattern in name_lower:
-            return False
-
-    return True
+    return _EXCLUDE_RE.search(name_lower) is None
 
 
+@lru_cache(maxsize=20000)
 def _clean_company_name(security_name: str) -> str:
     """
     Clean up a security name into a usable company name for matching.
@@ -133,129 +204,134 @@ def _clean_company_name(security_name: str) -> str:
     name = security_name.split(' - ')[0].strip()
 
     # Remove class designations first (before suffix stripping)
-    name = re.sub(r'\s+Class\s+[A-Z]\b', '', name, flags=re.IGNORECASE)
-
-    # Remove common corporate suffixes (order matters - longer first)
-    suffixes = [
-        ' Incorporated', ' incorporated',
-        ' Corporation', ' corporation',
-        ' Common Stock', ' common stock',
-        ' Ordinary Shares', ' ordinary shares',
-        ' American Depositary Shares',
-        ' Holdings', ' holdings',
-        ' Group', ' group',
-        ' Inc.', ' inc.', ' Inc', ' inc',
-        ' Corp.', ' corp.', ' Corp', ' corp',
-        ' Ltd.', ' ltd.', ' Ltd', ' ltd',
-        ' Limited', ' limited',
-        ' PLC', ' plc', ' Plc',
-        ' Co.', ' co.', ' Co', ' co',
-        ' Company', ' company',
-        ' S.A.', ' s.a.',
-        ' N.V.', ' n.v.',
-        ' SE', ' AG',
-    ]
-
-    for suffix in suffixes:
-        if name.endswith(suffix):
-            name = name[:-len(suffix)].strip()
+    name = _CLASS_RE.sub('', name)
+
+    # Remove common corporate suffixes. At most one suffix can match the end
+    # of the name, and a suffix is only stripped if it comes later in
+    # _SUFFIXES than the previous one ("Foo Holdings Inc." -> "Foo Holdings").
+    last_index = -1
+    match = _SUFFIX_RE.search(name)
+    while match and _SUFFIX_ORDER[match.group()] > last_index:
+        last_index = _SUFFIX_ORDER[match.group()]
+        name = name[:match.start()].strip()
+        match = _SUFFIX_RE.search(name)
 
     # Clean up trailing punctuation and whitespace
-    name = name.strip(' ,.')
+    name = name.strip(_TRAIL)
 
-    # Collapse multiple spaces
-    name = ' '.join(name.split())
+    # Collapse multiple spaces. Most names have none, so skip the split/join
+    # unless there is a double space or other whitespace (tabs, NBSP, ...),
+    # which isprintable() reports as non-printable.
+    if '  ' in name or not name.isprintable():
+        name = ' '.join(name.split())
 
     return name.lower()
 
 
-def download_nasdaq_tickers() -> List[Dict]:
+def iter_nasdaq_tickers() -> Iterator[Dict]:
     """
     Download ticker data from NASDAQ's public traded list.
     Filters to only include common stocks (no ETFs, warrants, trusts, etc.).
 
+    The request is made and its status checked when this is called, so a
+    failed download raises before any database work starts. Tickers are
+    then yielded as rows are parsed, so the download, parsing and a
+    consuming bulk_insert overlap without building the full list.
+
     Returns:
-        List of dicts with keys: name, ticker, exchange
+        Iterator of dicts with keys: name, ticker, exchange, full_name
     """
     url = "https://www.nasdaqtrader.com/dynamic/SymDir/nasdaqtraded.txt"
     print(f"Downloading from {url}...")
 
-    req = Request(url, headers={'User-Agent': 'Mozilla/5.0'})
-    response = urlopen(req, timeout=30)
-    content = response.read().decode('utf-8')
+    response = _HTTP.request('GET', url, preload_content=False)
+    if response.status != 200:
+        response.release_conn()
+        raise RuntimeError(f"Download failed: HTTP {response.status} from {url}")
 
-    tickers = []
+    return _iter_nasdaq_rows(response)
+
+
+def _iter_nasdaq_rows(response) -> Iterator[Dict]:
+    """
+    Parse a streamed nasdaqtraded.txt response into common-stock ticker dicts.
+
+    Args:
+        response: Open urllib3 response from iter_nasdaq_tickers()
+
+    Yields:
+        Dicts with keys: name, ticker, exchange, full_name
+    """
+    downloaded = 0
     skipped = {'etf': 0, 'non_stock': 0, 'bad_symbol': 0, 'test': 0, 'short_name': 0}
-    lines = content.strip().split('\n')
-
-    # Skip header and footer
-    for line in lines[1:]:
-        if line.startswith('File Creation Time'):
-            continue
-
-        fields = line.split('|')
-        if len(fields) < 8:
-            continue
-
-        # Fields: Nasdaq Traded|Symbol|Security Name|Listing Exchange|...
-        symbol = fields[1].strip()
-        security_name = fields[2].strip()
-        listing_exchange = fields[3].strip()
-        etf = fields[5].strip() if len(fields) > 5 else 'N'
-        test_issue = fields[7].strip() if len(fields) > 7 else 'N'
-
-        # Skip test issues
-        if test_issue == 'Y':
-            skipped['test'] += 1
-            continue
-
-        # Skip blank symbols and symbols with special chars (preferred shares, etc.)
-        if not symbol or len(symbol) > 10:
-            skipped['bad_symbol'] += 1
-            continue
-        if any(c in symbol for c in ['$', '.', ' ']):
-            skipped['bad_symbol'] += 1
-            continue
-
-        # Filter to common stocks only
-        if not _is_common_stock(security_name, etf):
+
+    try:
+        # Parse rows as they stream in rather than buffering the whole file.
+        # The file is unquoted pipe-delimited text, so quote handling is disabled.
+        reader = csv.reader(
+            io.TextIOWrapper(response, encoding='utf-8', newline=''),
+            delimiter='|',
+            quoting=csv.QUOTE_NONE
+        )
+        next(reader, None)  # header
+
+        for fields in reader:
+            # Skip footer
+            if fields and fields[0].startswith('File Creation Time'):
+                continue
+
+            if len(fields) < 8:
+                continue
+
+            # Fields: Nasdaq Traded|Symbol|Security Name|Listing Exchange|...
+            symbol = fields[1].strip()
+            security_name = fields[2].strip()
+            listing_exchange = fields[3].strip()
+            etf = fields[5].strip() if len(fields) > 5 else 'N'
+            test_issue = fields[7].strip() if len(fields) > 7 else 'N'
+
+            # Skip test issues
+            if test_issue == 'Y':
+                skipped['test'] += 1
+                continue
+
+            # Skip blank symbols and symbols with special chars (preferred shares, etc.)
+            if not symbol or len(symbol) > 10 or _BAD_SYMBOL_RE.search(symbol):
+                skipped['bad_symbol'] += 1
+                continue
+
+            # Filter to common stocks only
             if etf == 'Y':
                 skipped['etf'] += 1
-            else:
+                continue
+            if not _is_common_stock(security_name.lower()):
                 skipped['non_stock'] += 1
-            continue
-
-        # Map exchange codes
-        exchange_map = {
-            'Q': 'NASDAQ',
-            'N': 'NYSE',
-            'A': 'AMEX',
-            'P': 'NYSE ARCA',
-            'Z': 'BATS',
-            'V': 'IEXG',
-        }
-        exchange = exchange_map.get(listing_exchange, listing_exchange)
-
-        # Clean up the company name
-        clean_name = _clean_company_name(security_name)
-
-        # Skip entries with very short or empty names after cleanup
-        if not clean_name or len(clean_name) < 2:
-            skipped['short_name'] += 1
-            continue
-
-        tickers.append({
-            'name': clean_name,
-            'ticker': symbol,
-            'exchange': exchange,
-            'full_name': security_name,
-        })
-
-    print(f"Downloaded {len(tickers)} common stocks")
+                continue
+
+            exchange = _EXCHANGE_MAP.get(listing_exchange, listing_exchange)
+
+            # Clean up the company name
+            clean_name = _clean_company_name(security_name)
+
+            # Skip entries with very short or empty names after cleanup
+            if not clean_name or len(clean_name) < 2:
+                skipped['short_name'] += 1
+                continue
+
+            downloaded += 1
+            yield {
+                'name': clean_name,
+                'ticker': symbol,
+                'exchange': exchange,
+                'full_name': security_name,
+            }
+    finally:
+        response.release_conn()
+
+    print(f"Downloaded {downloaded} common stocks")
     print(f"Skipped: {skipped['etf']} ETFs, {skipped['non_stock']} non-stocks "
           f"(warrants/trusts/preferred/etc.), {skipped['bad_symbol']} bad symbols, "
           f"{skipped['test']} test issues, {skipped['short_name']} empty names")
-    return tickers
 
 
 def import_from_csv(filepath: str) -> List[Dict]:
@@ -298,122 +374,156 @@ def seed_from_hardcoded() -> List[Dict]:
         List of dicts with keys: name, ticker, exchange, full_name, aliases
     """
     sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-    from services.stock_ticker_data import COMPANY_TICKER_MAP
+    from services.stock_ticker_data import COMPANY_TICKER_ROWS
 
-    tickers = []
-    for name, data in COMPANY_TICKER_MAP.items():
-        tickers.append({
-            'name': name.lower(),
-            'ticker': data['ticker'],
-            'exchange': data['exchange'],
-            'full_name': data['full_name'],
-            'aliases': data.get('aliases', []),
-        })
+    # Copy each row so callers can modify them without touching the shared data
+    tickers = [dict(row) for row in COMPANY_TICKER_ROWS]
 
     print(f"Loaded {len(tickers)} companies from stock_ticker_data.py")
     return tickers
 
 
-def bulk_insert(tickers: List[Dict], include_aliases: bool = True):
+def _batched(items, size: int):
+    """Yield lists of up to `size` items from an iterable."""
+    iterator = iter(items)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+def bulk_insert(tickers: Iterable[Dict], include_aliases: bool = True):
     """
     Insert tickers into the companies table, skipping duplicates.
 
+    Rows are sent in batches of INSERT_BATCH_SIZE via executemany, which
+    pymysql rewrites into multi-row INSERT statements. Repeated
+    (name, ticker) pairs within a batch are collapsed before sending; as
+    with the upsert itself, the last occurrence's values win.
+
     Args:
-        tickers: List of ticker dicts
+        tickers: Ticker dicts (a list or a generator such as iter_nasdaq_tickers())
         include_aliases: Whether to also insert aliases
     """
     connection = get_db_connection()
-    inserted = 0
-    skipped = 0
+    processed = 0
+    duplicates = 0
+    affected = 0
     alias_count = 0
+    with_aliases = []
 
     try:
         with connection.cursor() as cursor:
-            for t in tickers:
-                try:
+            # One explicit transaction for the whole load. Alias company ids are
+            # resolved from the rows just written, so FK checks can be skipped;
+            # unique checks stay on because the upsert relies on them.
+            cursor.execute("SET SESSION foreign_key_checks = 0")
+            cursor.execute("START TRANSACTION")
+
+            for batch in _batched(tickers, INSERT_BATCH_SIZE):
+                unique = {}
+                for t in batch:
+                    unique[(t['name'], t['ticker'])] = t
+                cursor.executemany(
+                    """INSERT INTO companies (name, ticker, exchange, full_name)
+                       VALUES (%s, %s, %s, %s)
+                       ON DUPLICATE KEY UPDATE
+                           full_name = VALUES(full_name),
+                           exchange = VALUES(exchange)""",
+                    [(t['name'], t['ticker'], t['exchange'], t['full_name'])
+                     for t in unique.values()]
+                )
+                affected += cursor.rowcount
+                processed += len(batch)
+                duplicates += len(batch) - len(unique)
+                if include_aliases:
+                    with_aliases.extend(t for t in batch if t.get('aliases'))
+
+            # Insert aliases in a second pass, resolving company ids by name
+            if include_aliases:
+                company_ids = {}
+                for batch in _batched(with_aliases, INSERT_BATCH_SIZE):
+                    placeholders = ', '.join(['%s'] * len(batch))
                     cursor.execute(
-                        """INSERT INTO companies (name, ticker, exchange, full_name)
-                           VALUES (%s, %s, %s, %s)
-                           ON DUPLICATE KEY UPDATE
-                               full_name = VALUES(full_name),
-                               exchange = VALUES(exchange)""",
-                        (t['name'], t['ticker'], t['exchange'], t['full_name'])
+                        f"SELECT id, name FROM companies WHERE name IN ({placeholders})",
+                        [t['name'] for t in batch]
                     )
-                    if cursor.rowcount > 0:
-                        inserted += 1
-                    else:
-                        skipped += 1
-
-                    # Insert aliases if provided
-                    if include_aliases and t.get('aliases'):
-                        company_id = cursor.lastrowid
-                        if not company_id:
-                            cursor.execute(
-                                "SELECT id FROM companies WHERE name = %s",
-                                (t['name'],)
-                            )
-                            row = cursor.fetchone()
-                            if row:
-                                company_id = row['id']
-
-                        if company_id:
-                            for alias in t['aliases']:
-                                try:
-                                    cursor.execute(
-                                        """INSERT INTO company_aliases (company_id, alias)
-                                           VALUES (%s, %s)
-                                           ON DUPLICATE KEY UPDATE alias = VALUES(alias)""",
-                                        (company_id, alias.lower())
-                                    )
-                                    alias_count += 1
-                                except pymysql.err.IntegrityError:
-                                    pass
-
-                except pymysql.err.IntegrityError as e:
-                    skipped += 1
+                    for row in cursor.fetchall():
+                        company_ids[row['name'].lower()] = row['id']
+
+                alias_rows = [
+                    (company_ids[t['name'].lower()], alias.lower())
+                    for t in with_aliases if t['name'].lower() in company_ids
+                    for alias in t['aliases']
+                ]
+                for batch in _batched(alias_rows, INSERT_BATCH_SIZE):
+                    cursor.executemany(
+                        """INSERT INTO company_aliases (company_id, alias)
+                           VALUES (%s, %s)
+                           ON DUPLICATE KEY UPDATE alias = VALUES(alias)""",
+                        batch
+                    )
+                alias_count = len(alias_rows)
 
             connection.commit()
 
         print(f"\nResults:")
-        print(f"  Inserted/Updated: {inserted}")
-        print(f"  Skipped (duplicate): {skipped}")
+        print(f"  Processed: {processed}")
+        print(f"  Duplicates skipped: {duplicates}")
+        print(f"  Rows affected: {affected} (1 per insert, 2 per update)")
         if include_aliases:
             print(f"  Aliases added: {alias_count}")
 
     except Exception as e:
+        connection.rollback()
         print(f"Error during import: {e}")
         import traceback
         traceback.print_exc()
     finally:
-        connection.close()
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute("SET SESSION foreign_key_checks = 1")
+        except Exception as e:
+            # Don't let this hide the original error, and don't hand a session
+            # with FK checks still off to later commands
+            print(f"Could not restore foreign_key_checks ({e}); dropping the connection")
+            close_db_connection()
+
+
+_STATS_SQL = """
+    SELECT 'total' AS kind, 'companies' AS k, COUNT(*) AS count FROM companies
+    UNION ALL
+    SELECT 'total', 'aliases', COUNT(*) FROM company_aliases
+    UNION ALL
+    SELECT 'exchange', exchange, COUNT(*) FROM companies GROUP BY exchange
+"""
 
 
 def show_stats():
     """Show current database statistics."""
     connection = get_db_connection()
-    try:
-        with connection.cursor() as cursor:
-            cursor.execute("SELECT COUNT(*) as count FROM companies")
-            companies = cursor.fetchone()['count']
-
-            cursor.execute("SELECT COUNT(*) as count FROM company_aliases")
-            aliases = cursor.fetchone()['count']
-
-            cursor.execute(
-                "SELECT exchange, COUNT(*) as count FROM companies "
-                "GROUP BY exchange ORDER BY count DESC"
-            )
-            by_exchange = cursor.fetchall()
-
-            print(f"\nDatabase Statistics:")
-            print(f"  Total companies: {companies}")
-            print(f"  Total aliases: {aliases}")
-            print(f"\n  By exchange:")
-            for row in by_exchange:
-                print(f"    {row['exchange'] or 'Unknown'}: {row['count']}")
-
-    finally:
-        connection.close()
+    with connection.cursor() as cursor:
+        # All three counts in one round-trip; rows are tagged by kind
+        cursor.execute(_STATS_SQL)
+        rows = cursor.fetchall()
+
+        totals = {row['k']: row['count'] for row in rows if row['kind'] == 'total'}
+        companies = totals['companies']
+        aliases = totals['aliases']
+        by_exchange = sorted(
+            ({'exchange': row['k'], 'count': row['count']}
+             for row in rows if row['kind'] == 'exchange'),
+            key=lambda row: row['count'],
+            reverse=True
+        )
+
+        print(f"\nDatabase Statistics:")
+        print(f"  Total companies: {companies}")
+        print(f"  Total aliases: {aliases}")
+        print(f"\n  By exchange:")
+        for row in by_exchange:
+            print(f"    {row['exchange'] or 'Unknown'}: {row['count']}")
 
 
 def main():
@@ -443,22 +553,24 @@ def main():
 
     args = parser.parse_args()
 
-    if args.stats:
-        show_stats()
-    elif args.seed:
-        tickers = seed_from_hardcoded()
-        bulk_insert(tickers, include_aliases=True)
-        show_stats()
-    elif args.download:
-        tickers = download_nasdaq_tickers()
-        bulk_insert(tickers, include_aliases=False)
-        show_stats()
-    elif args.file:
-        tickers = import_from_csv(args.file)
-        bulk_insert(tickers, include_aliases=False)
-        show_stats()
-    else:
-        parser.print_help()
+    try:
+        if args.stats:
+            show_stats()
+        elif args.seed:
+            tickers = seed_from_hardcoded()
+            bulk_insert(tickers, include_aliases=True)
+            show_stats()
+        elif args.download:
+            bulk_insert(iter_nasdaq_tickers(), include_aliases=False)
+            show_stats()
+        elif args.file:
+            tickers = import_from_csv(args.file)
+            bulk_insert(tickers, include_aliases=False)
+            show_stats()
+        else:
+            parser.print_help()
+    finally:
+        close_db_connection()
 
 
 if __name__ == '__main__':
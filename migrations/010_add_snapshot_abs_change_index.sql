@@ -0,0 +1,15 @@
+-- Migration 010: Index absolute price change on article_stock_snapshots
+--
+-- The Telegram report ranks snapshots by ABS(price_change_since_article).
+-- An expression in ORDER BY cannot use an index, so MySQL filesorts the whole
+-- table to return the top 20 rows. A stored generated column with its own
+-- index lets the top-N be read directly from the index in descending order.
+--
+-- stock_prices already has idx_ticker_date (ticker, price_date), which covers
+-- the per-ticker price lookups used by the volume query.
+
+ALTER TABLE article_stock_snapshots
+ADD COLUMN abs_change DECIMAL(8, 4)
+    GENERATED ALWAYS AS (ABS(price_change_since_article)) STORED
+    COMMENT 'ABS(price_change_since_article), indexed for top movers',
+ADD INDEX idx_abs_change (abs_change);
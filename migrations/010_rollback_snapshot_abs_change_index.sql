@@ -0,0 +1,5 @@
+-- Rollback Migration 010: Remove absolute price change index
+
+ALTER TABLE article_stock_snapshots
+DROP INDEX idx_abs_change,
+DROP COLUMN abs_change;
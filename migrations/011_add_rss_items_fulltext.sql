@@ -0,0 +1,13 @@
+-- Migration 011: Full-text index for keyword search on rss_items
+--
+-- search_news used to filter with
+--     title LIKE '%kw%' OR summary LIKE '%kw%' OR content LIKE '%kw%'
+-- A leading wildcard cannot use an index, so every search scanned all three
+-- columns of every row. A FULLTEXT index lets MATCH ... AGAINST look words up
+-- in a single index probe instead.
+--
+-- InnoDB ignores words shorter than innodb_ft_min_token_size (default 3), so
+-- search_news still falls back to LIKE for keywords shorter than that.
+
+ALTER TABLE rss_items
+ADD FULLTEXT INDEX ft_items (title, summary, content);
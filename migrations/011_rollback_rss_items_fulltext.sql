@@ -0,0 +1,4 @@
+-- Rollback Migration 011: Remove rss_items full-text index
+
+ALTER TABLE rss_items
+DROP INDEX ft_items;
@@ -0,0 +1,34 @@
+-- Migration 012: Normalize article tickers into rss_item_tickers
+--
+-- rss_items.stock_tickers holds a comma-separated list ("AAPL,MSFT"), so a
+-- ticker filter has to run FIND_IN_SET / LIKE over every row. This table
+-- stores one row per (article, ticker), which lets a ticker filter do an
+-- index seek on (ticker, item_id).
+--
+-- stock_tickers is kept as the denormalized display value; ticker extraction
+-- writes both.
+--
+-- The foreign key to rss_items is added by migration 013.
+
+CREATE TABLE IF NOT EXISTS rss_item_tickers (
+    item_id BIGINT UNSIGNED NOT NULL COMMENT 'rss_items.id',
+    ticker VARCHAR(20) NOT NULL,
+    PRIMARY KEY (item_id, ticker),
+    INDEX idx_ticker_item (ticker, item_id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- Backfill: split stock_tickers on ',' (up to 50 tickers per article)
+INSERT IGNORE INTO rss_item_tickers (item_id, ticker)
+SELECT ri.id,
+       TRIM(SUBSTRING_INDEX(SUBSTRING_INDEX(ri.stock_tickers, ',', n.n), ',', -1)) AS ticker
+FROM rss_items ri
+JOIN (
+    SELECT tens.d * 10 + ones.d + 1 AS n
+    FROM (SELECT 0 AS d UNION ALL SELECT 1 UNION ALL SELECT 2 UNION ALL SELECT 3
+          UNION ALL SELECT 4 UNION ALL SELECT 5 UNION ALL SELECT 6
+          UNION ALL SELECT 7 UNION ALL SELECT 8 UNION ALL SELECT 9) ones
+    CROSS JOIN (SELECT 0 AS d UNION ALL SELECT 1 UNION ALL SELECT 2
+                UNION ALL SELECT 3 UNION ALL SELECT 4) tens
+) n ON n.n <= 1 + LENGTH(ri.stock_tickers) - LENGTH(REPLACE(ri.stock_tickers, ',', ''))
+WHERE ri.stock_tickers IS NOT NULL AND ri.stock_tickers != ''
+HAVING ticker != '';
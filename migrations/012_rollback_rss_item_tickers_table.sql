@@ -0,0 +1,3 @@
+-- Rollback Migration 012: Drop rss_item_tickers
+
+DROP TABLE IF EXISTS rss_item_tickers;
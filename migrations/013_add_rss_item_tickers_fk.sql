@@ -0,0 +1,18 @@
+-- Migration 013: Cascade rss_item_tickers deletes from rss_items
+--
+-- Migration 012 left rss_item_tickers without a foreign key, so deleting an
+-- article (directly, or through the ON DELETE CASCADE from rss_feeds) left its
+-- ticker rows behind. If an id is later reused, the new article inherits them
+-- in ticker searches.
+--
+-- item_id is BIGINT UNSIGNED, the rss_items.id type that migrations 006 and
+-- 009 already require for their foreign keys.
+
+-- Remove rows whose article is already gone
+DELETE t FROM rss_item_tickers t
+LEFT JOIN rss_items i ON i.id = t.item_id
+WHERE i.id IS NULL;
+
+ALTER TABLE rss_item_tickers
+ADD CONSTRAINT fk_item_tickers_item
+    FOREIGN KEY (item_id) REFERENCES rss_items(id) ON DELETE CASCADE;
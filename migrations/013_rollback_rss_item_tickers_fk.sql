@@ -0,0 +1,4 @@
+-- Rollback Migration 013: Remove the rss_item_tickers foreign key
+
+ALTER TABLE rss_item_tickers
+DROP FOREIGN KEY fk_item_tickers_item;
@@ -2,6 +2,9 @@
 
 # Migration Runner Script
 # Runs all migrations in the correct order with error checking
+#
+# Covers migrations 001-003 only; 004 onwards are applied by hand in
+# numerical order (see README.md, "Later Migrations").
 
 set -e  # Exit on error
 